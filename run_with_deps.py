@@ -9,6 +9,8 @@ import subprocess
 import re
 import os
 import importlib
+import threading
+from collections import deque
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -58,6 +60,47 @@ MODULE_TO_PACKAGE = {
 }
 
 
+# Only the tail of pip/child output is kept in memory for error reporting
+OUTPUT_TAIL_LINES = 200
+
+
+def run_pip(cmd, timeout):
+    """
+    Run a pip command, streaming its output instead of buffering all of it.
+    
+    Returns (returncode, tail) where tail holds the last OUTPUT_TAIL_LINES
+    lines of combined stdout/stderr. Raises subprocess.TimeoutExpired if the
+    command does not finish within timeout seconds.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors='replace',
+        bufsize=1
+    )
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    killer = threading.Timer(timeout, kill_on_timeout)
+    killer.start()
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    try:
+        for line in process.stdout:
+            tail.append(line)
+        returncode = process.wait()
+    finally:
+        killer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=''.join(tail))
+    return returncode, ''.join(tail)
+
+
 def install_package(package_name, quiet=True):
     """Install a package using pip."""
     safe_print(f"\n📦 Installing missing package: {package_name}")
@@ -67,20 +110,15 @@ def install_package(package_name, quiet=True):
             cmd.append("-q")
         cmd.append(package_name)
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        returncode, output = run_pip(cmd, timeout=300)  # 5 minute timeout
         
-        if result.returncode == 0:
+        if returncode == 0:
             safe_print(f"✅ Successfully installed {package_name}")
             return True
         else:
-            safe_print(f"⚠️  Warning: pip install returned error code {result.returncode}")
-            if result.stderr:
-                print(f"Error: {result.stderr[:200]}")
+            safe_print(f"⚠️  Warning: pip install returned error code {returncode}")
+            if output:
+                print(f"Error: {output[-200:]}")
             return False
     except subprocess.TimeoutExpired:
         safe_print(f"❌ Timeout installing {package_name}")
@@ -144,19 +182,17 @@ def check_and_install_requirements():
     if os.path.exists(requirements_file):
         safe_print("📋 Installing dependencies from requirements.txt...")
         try:
-            result = subprocess.run(
+            run_pip(
                 [sys.executable, "-m", "pip", "install", "-q", "--upgrade", "pip"],
-                capture_output=True,
                 timeout=60
             )
             
-            result = subprocess.run(
+            returncode, _ = run_pip(
                 [sys.executable, "-m", "pip", "install", "-q", "-r", requirements_file],
-                capture_output=True,
                 timeout=600  # 10 minute timeout for requirements.txt
             )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 safe_print("✅ Dependencies check complete\n")
                 return True
             else:
@@ -199,8 +235,8 @@ def run_main_with_auto_install(max_retries=10):
                 cwd=os.getcwd()
             )
             
-            # Capture stderr in real-time
-            stderr_lines = []
+            # Capture stderr in real-time (the traceback we need is at the end)
+            stderr_lines = deque(maxlen=OUTPUT_TAIL_LINES)
             while True:
                 output = process.stderr.readline()
                 if output == '' and process.poll() is not None:
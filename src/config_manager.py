@@ -92,6 +92,12 @@ class ConfigManager:
         """Get a global setting value"""
         return self.config.get('Global', key, fallback=default)
 
+    def snapshot(self) -> Dict[str, str]:
+        """Get a plain dict copy of all global settings"""
+        if 'Global' not in self.config:
+            return {}
+        return dict(self.config['Global'])
+
     def set_global_setting(self, key: str, value: str) -> None:
         """Set a global setting value"""
         if 'Global' not in self.config:
@@ -99,6 +105,14 @@ class ConfigManager:
         self.config['Global'][key] = value
         self.save_config()
 
+    def set_global_settings(self, values: Dict[str, str]) -> None:
+        """Set several global setting values and save once"""
+        if 'Global' not in self.config:
+            self.create_global_section()
+        for key, value in values.items():
+            self.config['Global'][key] = value
+        self.save_config()
+
     def get_background_color(self) -> str:
         """Get background color with fallback"""
         return self.get_global_setting('background_color', '#000000')
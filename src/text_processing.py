@@ -8,6 +8,7 @@ import numpy as np
 from collections import OrderedDict
 from src.config_manager import ConfigManager
 import logging
+import threading
 import cv2
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,8 @@ class TextProcessor:
         self.last_quota_reset = datetime.now().date()
         self.config_manager = ConfigManager()
         self.translation_history: List[Dict] = []
+        # Guards PaddleOCR model loading, which may run on a warm-up thread
+        self._paddleocr_lock = threading.Lock()
         logger.info("TextProcessor initialization complete.")
 
     def detect_text(self, image: np.ndarray) -> str:
@@ -212,14 +215,9 @@ class TextProcessor:
                 logger.error(f"Error detecting text with Tesseract: {str(e)}", exc_info=True)
                 return ""
     
-    def _detect_text_paddleocr(self, image: np.ndarray) -> str:
-        """Detect text using PaddleOCR."""
-        if not PADDLEOCR_AVAILABLE:
-            logger.error("PaddleOCR not available. Please install paddleocr.")
-            return ""
-        
-        try:
-            # Initialize PaddleOCR if not already initialized
+    def get_paddleocr(self) -> 'PaddleOCR':
+        """Return the PaddleOCR engine, loading its models on first use (thread-safe)."""
+        with self._paddleocr_lock:
             if not hasattr(self, '_paddleocr_instance'):
                 logger.info("Initializing PaddleOCR with PP-OCRv4 model...")
                 # Use PP-OCRv4 model for better accuracy
@@ -247,6 +245,16 @@ class TextProcessor:
                     else:
                         logger.error(f"Error initializing PaddleOCR with PP-OCRv4: {e}", exc_info=True)
                         raise
+            return self._paddleocr_instance
+
+    def _detect_text_paddleocr(self, image: np.ndarray) -> str:
+        """Detect text using PaddleOCR."""
+        if not PADDLEOCR_AVAILABLE:
+            logger.error("PaddleOCR not available. Please install paddleocr.")
+            return ""
+        
+        try:
+            paddleocr = self.get_paddleocr()
             
             # Convert numpy array to RGB if needed (PaddleOCR expects RGB)
             if len(image.shape) == 3 and image.shape[2] == 3:
@@ -256,7 +264,7 @@ class TextProcessor:
                 image_rgb = image
             
             # Use PaddleOCR to extract text
-            result = self._paddleocr_instance.ocr(image_rgb, cls=True)
+            result = paddleocr.ocr(image_rgb, cls=True)
             
             if not result or not result[0]:
                 logger.debug("PaddleOCR detected no text")
@@ -410,11 +418,22 @@ class TextProcessor:
         """Increment the translation API call counter."""
         self.translation_api_calls_today += 1
     
+    def set_google_clients(self, translate_client: Optional[translate.Client],
+                           vision_client: Optional[vision.ImageAnnotatorClient]) -> None:
+        """Update the Google Cloud translation and vision clients."""
+        logger.info("Updating Google Cloud clients in TextProcessor")
+        self.translate_client = translate_client
+        self.vision_client = vision_client
+    
     def set_llm_studio_translator(self, llm_studio_translator: Optional['LLMStudioTranslator']) -> None:
         """Update the LLM Studio translator instance."""
         logger.info("Updating LLM Studio translator in TextProcessor")
         self.llm_studio_translator = llm_studio_translator
     
+    def has_llm_studio_translator(self) -> bool:
+        """Return True if an LLM Studio translator is currently attached."""
+        return self.llm_studio_translator is not None
+    
     def set_libretranslate_translator(self, libretranslate_translator: Optional['LibreTranslateTranslator']) -> None:
         """Update the LibreTranslate translator instance."""
         logger.info("Updating LibreTranslate translator in TextProcessor")
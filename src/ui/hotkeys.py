@@ -0,0 +1,63 @@
+import os
+import logging
+from typing import Callable, Dict, Optional
+from PyQt5.QtCore import QTimer, QAbstractNativeEventFilter, QCoreApplication
+
+logger = logging.getLogger(__name__)
+
+IS_WINDOWS = os.name == 'nt'
+WM_HOTKEY = 0x0312
+
+if IS_WINDOWS:
+    from ctypes import wintypes
+
+    # Field offsets inside MSG so the filter can peek at single fields
+    _MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+    _MSG_WPARAM_OFFSET = wintypes.MSG.wParam.offset
+
+    class WindowsHotkeyDispatcher(QAbstractNativeEventFilter):
+        """Single native event filter that routes WM_HOTKEY events by hotkey ID."""
+
+        def __init__(self):
+            super().__init__()
+            self.callbacks: Dict[int, Callable] = {}
+            self.installed = False
+
+        def register(self, hotkey_id: int, callback: Callable) -> bool:
+            """Route WM_HOTKEY events for hotkey_id to callback on the UI thread."""
+            if not self.installed:
+                app = QCoreApplication.instance()
+                if app is None:
+                    logger.warning("No QCoreApplication instance; cannot install hotkey dispatcher")
+                    return False
+                app.installNativeEventFilter(self)
+                self.installed = True
+            self.callbacks[hotkey_id] = callback
+            return True
+
+        def unregister(self, hotkey_id: Optional[int]):
+            """Stop routing events for hotkey_id."""
+            self.callbacks.pop(hotkey_id, None)
+
+        def nativeEventFilter(self, event_type, message):
+            if not self.callbacks:
+                return False, 0
+            if event_type == "windows_generic_MSG":
+                try:
+                    address = int(message)
+                    # Read only the message ID; most native events are not hotkeys
+                    if wintypes.UINT.from_address(address + _MSG_MESSAGE_OFFSET).value != WM_HOTKEY:
+                        return False, 0
+                    hotkey_id = wintypes.WPARAM.from_address(address + _MSG_WPARAM_OFFSET).value
+                except (ValueError, TypeError):
+                    return False, 0
+                callback = self.callbacks.get(hotkey_id)
+                if callback is not None:
+                    QTimer.singleShot(0, callback)
+                    return True, 0
+            return False, 0
+
+    # Shared by MainWindow and every TranslationWindow
+    HOTKEY_DISPATCHER = WindowsHotkeyDispatcher()
+else:
+    HOTKEY_DISPATCHER = None
@@ -2,36 +2,57 @@ import os
 import sys
 import logging
 import time
-from typing import Optional
+import importlib
+import itertools
+from functools import cached_property, partial
+from types import MappingProxyType
+from typing import Dict, Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QGroupBox, QLabel,
     QPushButton, QComboBox, QLineEdit, QTreeWidget, QTreeWidgetItem,
-    QFileDialog, QColorDialog, QMessageBox, QApplication, QCheckBox, QSpinBox
+    QFileDialog, QColorDialog, QMessageBox, QApplication, QCheckBox, QSpinBox, QDoubleSpinBox, QFrame,
+    QToolButton, QStackedWidget, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer, QEvent, QThread, pyqtSignal, QAbstractNativeEventFilter, QCoreApplication
-from PyQt5.QtGui import QIcon, QColor, QKeySequence
+from PyQt5.QtCore import Qt, QTimer, QEvent, QThread, pyqtSignal, QCoreApplication, QSignalMapper, QSignalBlocker, QStringListModel
+from PyQt5.QtGui import QIcon, QColor, QKeySequence, QPixmap
 from src.config_manager import ConfigManager
 from src.screen_capture import capture_screen_region
 from src.ui.translation_window import TranslationWindow
+from src.ui.hotkeys import HOTKEY_DISPATCHER
 from src.ui.utils import validate_credentials, show_error_message
 from src.text_processing import TextProcessor
 from src.version_checker import VersionChecker
 
 logger = logging.getLogger(__name__)
 
+# Translator classes resolved on first use, keyed by module prefix
+_TRANSLATOR_CLASS_NAMES = {
+    'llm_studio': 'LLMStudioTranslator',
+    'libretranslate': 'LibreTranslateTranslator',
+}
+_TRANSLATOR_CLS_CACHE = {}
+
+
+def _get_translator_cls(name: str) -> type:
+    """Import a translator class once and reuse it on later initializations."""
+    cls = _TRANSLATOR_CLS_CACHE.get(name)
+    if cls is None:
+        module = importlib.import_module(f'src.translator.{name}_translator')
+        cls = getattr(module, _TRANSLATOR_CLASS_NAMES[name])
+        _TRANSLATOR_CLS_CACHE[name] = cls
+    return cls
+
 # Import Windows hotkey support
 IS_WINDOWS = os.name == 'nt'
 if IS_WINDOWS:
     import ctypes
-    from ctypes import wintypes
-    WM_HOTKEY = 0x0312
     MOD_CONTROL = 0x0002
     MOD_SHIFT = 0x0004
     MOD_ALT = 0x0001
     HOTKEY_ID_BASE_MAIN = 0xB000
     
     # Virtual key code mapping (from translation_window.py)
-    VK_CODES = {
+    VK_CODES = MappingProxyType({
         # Numbers
         '0': 0x30, '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34,
         '5': 0x35, '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39,
@@ -51,31 +72,7 @@ if IS_WINDOWS:
         # Symbol keys
         '`': 0xC0, '-': 0xBD, '=': 0xBB, '[': 0xDB, ']': 0xDD,
         '\\': 0xDC, ';': 0xBA, "'": 0xDE, ',': 0xBC, '.': 0xBE, '/': 0xBF,
-    }
-    
-    class WindowsHotkeyFilterMain(QAbstractNativeEventFilter):
-        """Event filter to capture native WM_HOTKEY events for MainWindow."""
-        
-        def __init__(self, callback: callable):
-            super().__init__()
-            self.callback = callback
-            self.hotkey_id: Optional[int] = None
-        
-        def set_hotkey_id(self, hotkey_id: Optional[int]):
-            self.hotkey_id = hotkey_id
-        
-        def nativeEventFilter(self, event_type, message):
-            if self.hotkey_id is None:
-                return False, 0
-            if event_type == "windows_generic_MSG":
-                try:
-                    msg = ctypes.cast(int(message), ctypes.POINTER(wintypes.MSG)).contents
-                except (ValueError, TypeError):
-                    return False, 0
-                if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
-                    QTimer.singleShot(0, self.callback)
-                    return True, 0
-            return False, 0
+    })
 
 
 class LLMInitializationThread(QThread):
@@ -92,7 +89,7 @@ class LLMInitializationThread(QThread):
         """Initialize LLM Studio translator in background thread."""
         try:
             logger.info("Background thread: Initializing LLM Studio translator...")
-            from src.translator.llm_studio_translator import LLMStudioTranslator
+            LLMStudioTranslator = _get_translator_cls('llm_studio')
             
             # Use model name if configured, otherwise None for auto-detect
             model_name = self.model_name if self.model_name else None
@@ -111,6 +108,280 @@ class LLMInitializationThread(QThread):
             self.error.emit(error_msg)
 
 
+class VersionCheckThread(QThread):
+    """Thread for querying the latest release without blocking the UI."""
+    update_available = pyqtSignal(str, str)  # Emits latest version and download URL
+    
+    def __init__(self, version_checker: VersionChecker):
+        super().__init__()
+        self.version_checker = version_checker
+    
+    def run(self):
+        """Fetch release info in the background and report newer versions."""
+        update = self.version_checker.get_available_update()
+        if update:
+            self.update_available.emit(*update)
+
+
+class TranslatorWarmupThread(QThread):
+    """Thread for importing translator backends before they are first needed."""
+    
+    def run(self):
+        """Resolve every translator class so later initializations skip the import."""
+        for name in _TRANSLATOR_CLASS_NAMES:
+            try:
+                _get_translator_cls(name)
+            except Exception as e:
+                logger.debug(f"Background thread: could not preload {name} translator: {str(e)}")
+
+
+class OcrWarmupThread(QThread):
+    """Thread for loading the PaddleOCR models before the first capture needs them."""
+
+    def __init__(self, text_processor):
+        super().__init__()
+        self.text_processor = text_processor
+
+    def run(self):
+        """Load the PaddleOCR engine; the first capture otherwise loads it on the UI thread."""
+        try:
+            self.text_processor.get_paddleocr()
+        except Exception as e:
+            logger.debug(f"Background thread: could not preload PaddleOCR: {str(e)}")
+
+
+# Qt key code -> hotkey string, precomputed for HotkeyInput.get_key_string
+_KEY_STR_TABLE = {
+    # Number keys
+    **{Qt.Key_0 + i: chr(ord('0') + i) for i in range(10)},
+    # Letter keys
+    **{Qt.Key_A + i: chr(ord('A') + i) for i in range(26)},
+    # Function keys
+    **{Qt.Key_F1 + i: f"F{i + 1}" for i in range(12)},
+    # Special keys
+    Qt.Key_Space: "Space",
+    Qt.Key_Tab: "Tab",
+    Qt.Key_Backspace: "Backspace",
+    Qt.Key_Return: "Return",
+    Qt.Key_Enter: "Enter",
+    Qt.Key_Insert: "Insert",
+    Qt.Key_Delete: "Delete",
+    Qt.Key_Home: "Home",
+    Qt.Key_End: "End",
+    Qt.Key_PageUp: "PageUp",
+    Qt.Key_PageDown: "PageDown",
+    Qt.Key_Left: "Left",
+    Qt.Key_Right: "Right",
+    Qt.Key_Up: "Up",
+    Qt.Key_Down: "Down",
+    Qt.Key_QuoteLeft: "`",
+    Qt.Key_Minus: "-",
+    Qt.Key_Equal: "=",
+    Qt.Key_BracketLeft: "[",
+    Qt.Key_BracketRight: "]",
+    Qt.Key_Backslash: "\\",
+    Qt.Key_Semicolon: ";",
+    Qt.Key_Apostrophe: "'",
+    Qt.Key_Comma: ",",
+    Qt.Key_Period: ".",
+    Qt.Key_Slash: "/",
+}
+
+# Static QSS shared by every MainWindow instance
+_WIDGET_STYLE = """
+    QComboBox {
+        padding: 4px 6px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: white;
+        min-height: 20px;
+    }
+    QComboBox:hover {
+        border: 1px solid #2196F3;
+    }
+    QComboBox:focus {
+        border: 2px solid #2196F3;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    QComboBox::down-arrow {
+        width: 12px;
+        height: 12px;
+    }
+    QComboBox QAbstractItemView {
+        padding: 4px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        selection-background-color: #e3f2fd;
+    }
+    QLineEdit {
+        padding: 4px 6px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: white;
+        min-height: 20px;
+    }
+    QLineEdit:hover {
+        border: 1px solid #2196F3;
+    }
+    QLineEdit:focus {
+        border: 2px solid #2196F3;
+        background-color: #fafafa;
+    }
+"""
+
+# Top-level panel group boxes (colors match MainWindow.text_color / frame_bg)
+_PANEL_GROUP_STYLE = (
+    "QGroupBox { font: 10pt 'Google Sans'; color: #212121; background-color: #ffffff; padding-top: 10px; }"
+    "QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }"
+)
+
+# Settings panel: nested section groups are styled from here rather than per group.
+# They sit on the panel's own #ffffff fill, so they stay transparent instead of repainting it.
+_SETTINGS_GROUP_STYLE = _PANEL_GROUP_STYLE + (
+    "QGroupBox QGroupBox { background-color: transparent; padding-top: 8px; }"
+)
+
+# Button rules keyed by object name, filled with the window colors once per MainWindow
+# and applied together with _WIDGET_STYLE as the window's only stylesheet
+_BUTTON_STYLE = """
+    QPushButton#AccentButton {
+        background-color: %(bg)s; color: %(fg)s;
+        padding: 6px 12px; border-radius: 4px; font-weight: 500;
+    }
+    QPushButton#AccentButton:hover { background-color: %(hover)s; }
+    QPushButton#AccentButton:disabled {
+        background-color: #cccccc; color: #666666; border: 1px solid #999999;
+    }
+    QToolButton#ActionButton, QToolButton#DeleteButton {
+        padding: 3px; border-radius: 3px; font-size: 14px;
+    }
+    QToolButton#ActionButton { background-color: %(bg)s; color: %(fg)s; }
+    QToolButton#ActionButton:hover { background-color: %(hover)s; }
+    QToolButton#ActionButton[running="true"], QToolButton#DeleteButton {
+        background-color: #f44336; color: white;
+    }
+    QToolButton#ActionButton[running="true"]:hover, QToolButton#DeleteButton:hover {
+        background-color: #d32f2f;
+    }
+"""
+
+# Default translation window opacity
+_OPACITY_DEFAULT = 0.85
+# How long closeEvent waits for a background thread; VersionChecker.request_timeout fits inside it
+_THREAD_SHUTDOWN_WAIT_MS = 6000
+
+# Input method hints for URL, path and model-name fields, which never want suggestions
+_RAW_TEXT_HINTS = Qt.ImhNoPredictiveText | Qt.ImhNoAutoUppercase
+
+# Strings shared by several settings widgets
+_CHOOSE_COLOR_TEXT = "Choose Color"
+_INFO_LABEL_STYLE = "color: #666666; font-size: 9pt; font-style: italic;"
+_HOTKEY_INFO_TEXT = "💡 Click field and press keys"
+_HOTKEY_INFO_TOOLTIP = "Instructions: Click the input field, then press your desired key combination"
+_HOTKEY_APPLY_TOOLTIP = "Click to save and activate the new hotkey"
+# A valid hotkey needs at least one of these
+_HOTKEY_MODIFIERS = frozenset(('Ctrl', 'Shift', 'Alt'))
+
+# Provider configuration groups, built on first selection of their mode:
+# mode -> (attribute prefix, title, tooltip,
+#          fields: (widget attr, label text, label tooltip, config key, default, placeholder,
+#                   widget tooltip, allow empty),
+#          inline test button: (attr, text, tooltip, slot) or None)
+_PROVIDER_GROUPS = {
+    'local': (
+        'llm_studio', "🤖 LM Studio Configuration",
+        "Configure LM Studio API connection for local translation",
+        (
+            ('llm_studio_edit', "API URL:", "LM Studio API endpoint URL",
+             'llm_studio_url', 'http://localhost:1234/v1', "http://localhost:1234/v1",
+             "Enter LM Studio API URL (default: http://localhost:1234/v1)\nMake sure LM Studio is running with API enabled",
+             False),
+            ('llm_studio_model_edit', "Model Name:", "Specific model to use (optional)",
+             'llm_studio_model', '', "Leave empty for auto-detect",
+             "Enter a specific model name, or leave empty to auto-detect from LM Studio",
+             True),
+        ),
+        None,
+    ),
+    'libretranslate': (
+        'libretranslate', "🌍 LibreTranslate Configuration",
+        "Configure LibreTranslate API connection (free, open-source translation service)",
+        (
+            ('libretranslate_edit', "API URL:", "LibreTranslate server API endpoint",
+             'libretranslate_url', 'http://localhost:5000', "http://localhost:5000",
+             "Enter LibreTranslate API URL (default: http://localhost:5000)\nMake sure LibreTranslate server is running",
+             False),
+        ),
+        ('libretranslate_test_button', "Test Connection",
+         "Test if LibreTranslate API is accessible and working", 'test_libretranslate'),
+    ),
+}
+
+# Hotkey settings rows:
+# (attribute prefix, row layout attr, label text, label tooltip, config key, default,
+#  input tooltip, textChanged slot, Apply slot)
+_HOTKEY_ROWS = (
+    ('', 'toggle_hotkey_layout', "Pause/Resume Translation:",
+     "Hotkey to pause or resume translation in active windows",
+     'toggle_hotkey', 'Ctrl+1',
+     "Click here and press your desired key combination (e.g., Ctrl+1)",
+     'on_hotkey_changed', 'update_hotkey_setting'),
+    ('add_area_', 'add_area_hotkey_layout', "Add New Area:",
+     "Hotkey to quickly add a new translation area",
+     'add_area_hotkey', 'Ctrl+2',
+     "Click here and press your desired key combination (e.g., Ctrl+2)",
+     'on_add_area_hotkey_changed', 'update_add_area_hotkey_setting'),
+)
+
+
+def _make_area_item(area_id: str, x: int, y: int, w: int, h: int) -> QTreeWidgetItem:
+    """Create the tree row for an area; the Action column is filled by _add_action_button."""
+    item = QTreeWidgetItem([
+        "Area %s" % area_id,
+        "X: %d, Y: %d" % (x, y),
+        "W: %d, H: %d" % (w, h),
+        "",
+    ])
+    item.setData(0, Qt.UserRole, area_id)
+    # Keep the region itself so nothing has to parse it back out of the labels
+    item.setData(1, Qt.UserRole, (x, y, w, h))
+    return item
+
+
+# Translation and OCR modes in combo box order, with display labels and reverse lookups
+_MODES = ('google', 'local', 'libretranslate')
+_MODE_LABELS = ["Google Cloud", "Local (Tesseract + LM Studio)", "LibreTranslate (Tesseract + LibreTranslate)"]
+_MODE_INDEX = {mode: i for i, mode in enumerate(_MODES)}
+_OCR_MODES = ('tesseract', 'paddleocr')
+_OCR_MODE_LABELS = ["Tesseract OCR", "PaddleOCR"]
+_OCR_INDEX = {mode: i for i, mode in enumerate(_OCR_MODES)}
+
+# Font settings rows:
+# (label attr, label text, label tooltip, widget attr, widget class, combo items,
+#  config key, default, widget tooltip, change signal)
+_FONT_ROWS = (
+    ('font_label', "Font Family:", "Choose the font for displaying translated text",
+     'font_combo', QComboBox,
+     ("Google Sans", "Segoe UI", "Consolas", "Courier New", "Lucida Console", "Monospace"),
+     'font_family', 'Google Sans',
+     "Select the font family for translated text. Changes apply immediately to active translations.",
+     'currentTextChanged'),
+    ('size_label', "Size:", "Font size in pixels",
+     'font_size_edit', QLineEdit, None,
+     'font_size', '14',
+     "Enter font size (recommended: 12-20 pixels)",
+     'textChanged'),
+    ('style_label', "Style:", "Text style: normal, bold, or italic",
+     'font_style_combo', QComboBox, ("normal", "bold", "italic"),
+     'font_style', 'normal',
+     "Choose text style. Bold is recommended for better visibility.",
+     'currentTextChanged'),
+)
+
+
 class HotkeyInput(QLineEdit):
     """Custom QLineEdit for capturing keyboard shortcuts."""
     
@@ -165,54 +436,104 @@ class HotkeyInput(QLineEdit):
     
     def get_key_string(self, key):
         """Convert Qt key code to string representation."""
-        # Number keys
-        if Qt.Key_0 <= key <= Qt.Key_9:
-            return chr(key)
-        # Letter keys
-        elif Qt.Key_A <= key <= Qt.Key_Z:
-            return chr(key)
-        # Function keys
-        elif Qt.Key_F1 <= key <= Qt.Key_F12:
-            return f"F{key - Qt.Key_F1 + 1}"
-        # Special keys
-        special_keys = {
-            Qt.Key_Space: "Space",
-            Qt.Key_Tab: "Tab",
-            Qt.Key_Backspace: "Backspace",
-            Qt.Key_Return: "Return",
-            Qt.Key_Enter: "Enter",
-            Qt.Key_Insert: "Insert",
-            Qt.Key_Delete: "Delete",
-            Qt.Key_Home: "Home",
-            Qt.Key_End: "End",
-            Qt.Key_PageUp: "PageUp",
-            Qt.Key_PageDown: "PageDown",
-            Qt.Key_Left: "Left",
-            Qt.Key_Right: "Right",
-            Qt.Key_Up: "Up",
-            Qt.Key_Down: "Down",
-            Qt.Key_QuoteLeft: "`",
-            Qt.Key_Minus: "-",
-            Qt.Key_Equal: "=",
-            Qt.Key_BracketLeft: "[",
-            Qt.Key_BracketRight: "]",
-            Qt.Key_Backslash: "\\",
-            Qt.Key_Semicolon: ";",
-            Qt.Key_Apostrophe: "'",
-            Qt.Key_Comma: ",",
-            Qt.Key_Period: ".",
-            Qt.Key_Slash: "/",
-        }
-        return special_keys.get(key, None)
+        return _KEY_STR_TABLE.get(key)
     
     def focusInEvent(self, event):
         """Clear text when focused to allow new input."""
         super().focusInEvent(event)
         self.selectAll()
 
+class OcrTesseractPanel(QWidget):
+    """OCR engine and Tesseract path rows shared by the OCR-based provider groups."""
+
+    # Forwarded from the Tesseract path row, which is only built once Tesseract is selected
+    tesseract_path_changed = pyqtSignal(str)
+    tesseract_browse_clicked = pyqtSignal()
+    tesseract_test_clicked = pyqtSignal()
+    
+    def __init__(self, ocr_mode: str, tesseract_path: str, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        # OCR mode setting
+        self.ocr_mode_layout = QHBoxLayout()
+        self.ocr_mode_label = QLabel("Text Detection (OCR):")
+        self.ocr_mode_label.setToolTip("OCR engine for detecting text from screen")
+        self.ocr_mode_layout.addWidget(self.ocr_mode_label)
+        self.ocr_mode_combo = QComboBox()
+        self.ocr_mode_combo.addItems(_OCR_MODE_LABELS)
+        self.ocr_mode_combo.setCurrentIndex(_OCR_INDEX.get(ocr_mode, 1))
+        self.ocr_mode_combo.setToolTip("Tesseract: Free, widely available\nPaddleOCR: Better accuracy, requires installation")
+        self.ocr_mode_layout.addWidget(self.ocr_mode_combo)
+        layout.addLayout(self.ocr_mode_layout)
+
+        self._tesseract_path = tesseract_path
+        self.tesseract_path_layout: Optional[QHBoxLayout] = None
+        self.tesseract_path_edit: Optional[QLineEdit] = None
+        self.tesseract_browse_button: Optional[QPushButton] = None
+        self.tesseract_test_button: Optional[QPushButton] = None
+        self._tesseract_row_visible = False
+
+    def _build_tesseract_row(self):
+        """Create the Tesseract path row the first time it is shown."""
+        self.tesseract_path_layout = QHBoxLayout()
+        self.tesseract_path_label = QLabel("Tesseract Path:")
+        self.tesseract_path_label.setToolTip("Path to tesseract.exe (leave empty if Tesseract is in system PATH)")
+        self.tesseract_path_layout.addWidget(self.tesseract_path_label)
+        self.tesseract_path_edit = QLineEdit()
+        self.tesseract_path_edit.setPlaceholderText("Leave empty to use system PATH")
+        self.tesseract_path_edit.setText(self._tesseract_path)
+        self.tesseract_path_edit.setInputMethodHints(_RAW_TEXT_HINTS)
+        self.tesseract_path_edit.setToolTip("Enter full path to tesseract.exe, or leave empty if Tesseract is installed and in your system PATH")
+        self.tesseract_path_layout.addWidget(self.tesseract_path_edit)
+        self.tesseract_browse_button = QPushButton("Browse...")
+        self.tesseract_browse_button.setToolTip("Browse for tesseract.exe file")
+        self.tesseract_path_layout.addWidget(self.tesseract_browse_button)
+        
+        self.tesseract_test_button = QPushButton("Test")
+        self.tesseract_test_button.setToolTip("Test if Tesseract is installed and working correctly")
+        self.tesseract_path_layout.addWidget(self.tesseract_test_button)
+        self.layout().addLayout(self.tesseract_path_layout)
+
+        # Styled by MainWindow's stylesheet
+        for button in (self.tesseract_browse_button, self.tesseract_test_button):
+            button.setObjectName("AccentButton")
+
+        self.tesseract_path_edit.textChanged.connect(self.tesseract_path_changed)
+        self.tesseract_browse_button.clicked.connect(self.tesseract_browse_clicked)
+        self.tesseract_test_button.clicked.connect(self.tesseract_test_clicked)
+
+    def showEvent(self, event):
+        """Build the Tesseract path row if Tesseract was selected while the panel was hidden."""
+        super().showEvent(event)
+        if self._tesseract_row_visible and self.tesseract_path_layout is None:
+            self._build_tesseract_row()
+
+    def set_tesseract_path_visible(self, visible: bool):
+        """Show or hide the Tesseract path row, building it on first show."""
+        # Provider and OCR switches re-request the same state; skip the per-widget calls then
+        if visible == self._tesseract_row_visible:
+            return
+        self._tesseract_row_visible = visible
+        if self.tesseract_path_layout is None:
+            # Deferred to showEvent while the panel is hidden (e.g. in Google Cloud mode)
+            if not self.isVisible():
+                return
+            self._build_tesseract_row()
+        for i in range(self.tesseract_path_layout.count()):
+            widget = self.tesseract_path_layout.itemAt(i).widget()
+            if widget:
+                widget.setVisible(visible)
+
+
 class MainWindow(QMainWindow):
     """Main application window for the real-time screen translator."""
     
+    # Window icon, loaded from disk on first construction and shared afterwards
+    _APP_ICON: Optional[QIcon] = None
+    
     def __init__(self, text_processor: TextProcessor, config_manager: ConfigManager = None):
         super().__init__()
         self.setWindowTitle("Real-time Screen Translator - Settings & Areas")
@@ -220,7 +541,10 @@ class MainWindow(QMainWindow):
         # Set minimum window size to prevent window from being too small
         self.setMinimumSize(1000, 800)  # Minimum width: 700px, Minimum height: 400px
         try:
-            self.setWindowIcon(QIcon(os.path.join(os.path.dirname(__file__), "../../resources/logo.ico")))
+            cls = type(self)
+            if cls._APP_ICON is None:
+                cls._APP_ICON = QIcon(os.path.join(os.path.dirname(__file__), "../../resources/logo.ico"))
+            self.setWindowIcon(cls._APP_ICON)
         except Exception as e:
             logger.warning(f"Could not set window icon: {e}")
 
@@ -233,28 +557,61 @@ class MainWindow(QMainWindow):
         self.button_fg = "white"
         self.frame_bg = "#ffffff"
 
+        # Window stylesheet compiled once from the colors above
+        self._window_style = _WIDGET_STYLE + _BUTTON_STYLE % {
+            'bg': self.button_bg, 'fg': self.button_fg, 'hover': self.secondary_color,
+        }
+
         # Config manager
         self.config_manager = config_manager if config_manager else ConfigManager()
         
         # LLM initialization thread
         self.llm_init_thread = None
+        # (api_url, model) of the last successful initialization, keyed by translation mode
+        self._last_init_params = {}
 
-        # Version checker
-        self.version_checker = VersionChecker()
+        # Background update check thread (version checker is created on first use)
+        self.version_check_thread = None
+        # Time of the last update check, parsed once; an unreadable value forces a check
+        try:
+            self._last_update_check = int(self.config_manager.get_global_setting('last_update_check', '0'))
+        except ValueError:
+            self._last_update_check = 0
+
+        # Translator module preloading, started once the window has painted
+        self.translator_warmup_thread = TranslatorWarmupThread(self)
+        self._translator_warmup_timer = QTimer(self)
+        self._translator_warmup_timer.setSingleShot(True)
+        self._translator_warmup_timer.setInterval(500)
+        self._translator_warmup_timer.timeout.connect(
+            partial(self.translator_warmup_thread.start, QThread.LowestPriority))
+        self._translator_warmup_timer.start()
+
+        # PaddleOCR model loading, started by the first translation that uses it
+        self.ocr_warmup_thread = None
         
         # Global hotkey for add area
-        if IS_WINDOWS:
-            self.add_area_hotkey_id: Optional[int] = None
-            self.add_area_hotkey_filter: Optional['WindowsHotkeyFilterMain'] = None
-        else:
-            self.add_area_hotkey_id = None
-            self.add_area_hotkey_filter = None
-        self.version_check_timer = QTimer()
-        self.version_check_timer.timeout.connect(self.check_for_updates)
-        self.version_check_timer.start(3600000)  # Check every hour
+        self.add_area_hotkey_id: Optional[int] = None
+
+        # Settings panel is built once by init_ui
+        self._settings_built = False
+        # Last state applied to the settings controls (None until the first apply)
+        self._settings_enabled: Optional[bool] = None
+        # Requested state; bursts of update_settings_state calls apply once per event-loop turn
+        self._pending_settings_state = True
+        self._settings_state_timer = QTimer(self)
+        self._settings_state_timer.setSingleShot(True)
+        self._settings_state_timer.setInterval(0)
+        self._settings_state_timer.timeout.connect(self._apply_settings_state)
+        # Text and language settings last saved by update_translation_settings
+        self._applied_text_settings: Optional[Dict] = None
 
         # Initialize translation windows dictionary before loading areas
         self.translation_windows = {}
+        # Tree row for each area ID, kept in step with areas_tree
+        self._area_items: Dict[str, QTreeWidgetItem] = {}
+        # Start/Stop button for each area row
+        self._action_buttons: Dict[str, QToolButton] = {}
         
         # Initialize UI
         self.init_ui()
@@ -268,7 +625,7 @@ class MainWindow(QMainWindow):
         self.text_processor = text_processor
 
         # Check for updates after a short delay to ensure the window is fully loaded
-        QTimer.singleShot(2000, self.check_for_updates)
+        self._schedule_version_check(2000)
         
         # Register add area hotkey
         if IS_WINDOWS:
@@ -281,6 +638,12 @@ class MainWindow(QMainWindow):
             llm_studio_url = self.config_manager.get_llm_studio_url()
             llm_studio_model = self.config_manager.get_llm_studio_model()
             
+            # Nothing to do if the live translator was built from the same settings
+            if (self._last_init_params.get('local') == (llm_studio_url, llm_studio_model)
+                    and self.text_processor.has_llm_studio_translator()):
+                logger.info("LLM Studio translator already initialized with current settings, skipping")
+                return
+            
             # Create and start the initialization thread
             self.llm_init_thread = LLMInitializationThread(llm_studio_url, llm_studio_model)
             self.llm_init_thread.initialized.connect(self.on_llm_initialized)
@@ -295,6 +658,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info("LLM Studio translator initialized successfully, updating TextProcessor")
             self.text_processor.set_llm_studio_translator(llm_studio_translator)
+            if self.llm_init_thread:
+                self._last_init_params['local'] = (self.llm_init_thread.api_url, self.llm_init_thread.model_name)
             logger.info("TextProcessor updated with LLM Studio translator")
         except Exception as e:
             logger.error(f"Error updating TextProcessor with LLM translator: {str(e)}", exc_info=True)
@@ -316,105 +681,122 @@ class MainWindow(QMainWindow):
         self.main_layout.setContentsMargins(20, 20, 20, 20)
         self.main_layout.setSpacing(15)
 
-        # Apply global styling for comboboxes and text boxes
-        widget_style = """
-            QComboBox {
-                padding: 4px 6px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: white;
-                min-height: 20px;
-            }
-            QComboBox:hover {
-                border: 1px solid #2196F3;
-            }
-            QComboBox:focus {
-                border: 2px solid #2196F3;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QComboBox::down-arrow {
-                width: 12px;
-                height: 12px;
-            }
-            QComboBox QAbstractItemView {
-                padding: 4px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                selection-background-color: #e3f2fd;
-            }
-            QLineEdit {
-                padding: 4px 6px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: white;
-                min-height: 20px;
-            }
-            QLineEdit:hover {
-                border: 1px solid #2196F3;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2196F3;
-                background-color: #fafafa;
-            }
-        """
-        self.setStyleSheet(widget_style)
+        # Apply global styling for comboboxes, text boxes and buttons
+        self.setStyleSheet(self._window_style)
+
+        # Settings panel, built without intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_settings_panel()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Translation areas panel
+        self.areas_group = QGroupBox("📍 Translation Areas")
+        self.areas_group.setStyleSheet(_PANEL_GROUP_STYLE)
+        self.areas_group.setToolTip("Manage your translation areas. Each area monitors a specific screen region for text to translate.")
+        self.main_layout.addWidget(self.areas_group)
+        self.areas_layout = QVBoxLayout(self.areas_group)
+        self.areas_layout.setSpacing(10)
+        self.areas_layout.setContentsMargins(10, 15, 10, 10)
+
+        self.areas_tree = QTreeWidget()
+        self.areas_tree.setHeaderLabels(["Name", "Position", "Size", "Action"])
+        self.areas_tree.setStyleSheet(f"background-color: {self.frame_bg};")
+        self.areas_tree.setColumnWidth(3, 80)  # Set Action column width for icon buttons (Start/Stop + Delete)
+        self.areas_tree.setToolTip("List of all translation areas. Use ▶ to start/stop translation, ✕ to delete.")
+        self.areas_layout.addWidget(self.areas_tree)
+
+        # Per-area action buttons map to their area ID through shared mappers
+        self._toggle_mapper = QSignalMapper(self)
+        self._toggle_mapper.mappedString.connect(self._toggle_area_translation)
+        self._delete_mapper = QSignalMapper(self)
+        self._delete_mapper.mappedString.connect(self._delete_area_by_id)
+
+        self.buttons_layout = QHBoxLayout()
+        self.areas_layout.addLayout(self.buttons_layout)
+
+        self.add_button = QPushButton("➕ Add New Area")
+        self.add_button.setToolTip("Add a new translation area by selecting a region on your screen\nYou can also use the 'Add Area' hotkey for quick access")
+        self.add_button.clicked.connect(self.add_area)
+        self.buttons_layout.addWidget(self.add_button)
+
+        # Styling buttons
+        self._apply_button_style(self.add_button)
+
+        # Translation windows
+        self.area_selected = False
+        self.language_code_to_name = {}
+        self.language_name_to_code = {}
+
+    def _build_settings_panel(self):
+        """Build the settings panel; later calls are no-ops."""
+        if self._settings_built:
+            return
+
+        # Read global settings once; widgets below index this snapshot
+        cfg = self.config_manager.snapshot()
 
-        # Settings panel
         self.settings_group = QGroupBox("⚙️ Settings & Configuration")
-        self.settings_group.setStyleSheet(
-            f"QGroupBox {{ font: 10pt 'Google Sans'; color: {self.text_color}; background-color: {self.frame_bg}; padding-top: 10px; }}"
-            f"QGroupBox::title {{ subcontrol-origin: margin; left: 10px; padding: 0 5px; }}"
-        )
+        self.settings_group.setStyleSheet(_SETTINGS_GROUP_STYLE)
         self.main_layout.addWidget(self.settings_group)
         self.settings_layout = QVBoxLayout(self.settings_group)
         self.settings_layout.setSpacing(10)
         self.settings_layout.setContentsMargins(10, 15, 10, 10)
 
+        # Text-field config writes are queued and saved together after typing pauses
+        self._pending_cfg = {}
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(300)
+        self._persist_timer.timeout.connect(self._flush_pending_config)
+
+        # Color buttons share one mapper instead of a lambda per button
+        self._color_mapper = QSignalMapper(self)
+        self._color_mapper.mappedString.connect(self.pick_color)
+
+        # Font edits only mark settings dirty; the timer drains them in one pass
+        self._settings_dirty = False
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.timeout.connect(self._flush_translation_settings)
+
+        # Opacity and auto-pause changes reach the windows once the spinboxes settle
+        self._window_push_timer = QTimer(self)
+        self._window_push_timer.setSingleShot(True)
+        self._window_push_timer.setInterval(150)
+        self._window_push_timer.timeout.connect(self._push_window_settings)
+
         # Font settings
         self.font_group = QGroupBox("📝 Text Display Settings")
-        self.font_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.font_group.setToolTip("Customize how translated text appears on screen")
         self.settings_layout.addWidget(self.font_group)
         self.font_layout = QHBoxLayout(self.font_group)
         self.font_layout.setSpacing(8)
 
-        self.font_label = QLabel("Font Family:")
-        self.font_label.setToolTip("Choose the font for displaying translated text")
-        self.font_layout.addWidget(self.font_label)
-        self.font_combo = QComboBox()
-        self.font_combo.addItems(["Google Sans", "Segoe UI", "Consolas", "Courier New", "Lucida Console", "Monospace"])
-        self.font_combo.setCurrentText(self.config_manager.get_global_setting('font_family', 'Google Sans'))
-        self.font_combo.setToolTip("Select the font family for translated text. Changes apply immediately to active translations.")
-        self.font_combo.currentTextChanged.connect(self.update_translation_settings)
-        self.font_layout.addWidget(self.font_combo)
-
-        self.size_label = QLabel("Size:")
-        self.size_label.setToolTip("Font size in pixels")
-        self.font_layout.addWidget(self.size_label)
-        self.font_size_edit = QLineEdit()
-        self.font_size_edit.setFixedWidth(50)
-        self.font_size_edit.setText(self.config_manager.get_global_setting('font_size', '14'))
-        self.font_size_edit.setPlaceholderText("14")
-        self.font_size_edit.setToolTip("Enter font size (recommended: 12-20 pixels)")
-        self.font_size_edit.textChanged.connect(self.update_translation_settings)
-        self.font_layout.addWidget(self.font_size_edit)
-
-        self.style_label = QLabel("Style:")
-        self.style_label.setToolTip("Text style: normal, bold, or italic")
-        self.font_layout.addWidget(self.style_label)
-        self.font_style_combo = QComboBox()
-        self.font_style_combo.addItems(["normal", "bold", "italic"])
-        self.font_style_combo.setCurrentText(self.config_manager.get_global_setting('font_style', 'normal'))
-        self.font_style_combo.setToolTip("Choose text style. Bold is recommended for better visibility.")
-        self.font_style_combo.currentTextChanged.connect(self.update_translation_settings)
-        self.font_layout.addWidget(self.font_style_combo)
+        # Font rows are built and wired from _FONT_ROWS in a single pass
+        for (label_attr, label_text, label_tip, widget_attr, widget_cls, items,
+             key, default, widget_tip, signal) in _FONT_ROWS:
+            label = QLabel(label_text)
+            label.setToolTip(label_tip)
+            self.font_layout.addWidget(label)
+            setattr(self, label_attr, label)
+
+            widget = widget_cls()
+            if items:
+                widget.addItems(list(items))
+                widget.setCurrentText(cfg.get(key, default))
+            else:
+                widget.setFixedWidth(50)
+                widget.setText(cfg.get(key, default))
+                widget.setPlaceholderText(default)
+            widget.setToolTip(widget_tip)
+            getattr(widget, signal).connect(self._mark_settings_dirty)
+            self.font_layout.addWidget(widget)
+            setattr(self, widget_attr, widget)
 
         # Color settings
         self.color_group = QGroupBox("🎨 Text Color Settings")
-        self.color_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.color_group.setToolTip("Set colors for character names and dialogue text")
         self.settings_layout.addWidget(self.color_group)
         self.color_layout = QHBoxLayout(self.color_group)
@@ -423,34 +805,29 @@ class MainWindow(QMainWindow):
         self.name_color_label = QLabel("Character Name:")
         self.name_color_label.setToolTip("Color for character/speaker names")
         self.color_layout.addWidget(self.name_color_label)
-        self.name_color_button = QPushButton("Choose Color")
+        self.name_color_button = QPushButton(_CHOOSE_COLOR_TEXT)
         self.name_color_button.setToolTip("Click to pick a color for character names")
-        self.name_color_button.clicked.connect(lambda: self.pick_color('name_color'))
+        self._color_mapper.setMapping(self.name_color_button, 'name_color')
+        self.name_color_button.clicked.connect(self._color_mapper.map)
         self.color_layout.addWidget(self.name_color_button)
-        self.name_color_preview = QLabel()
-        self.name_color_preview.setFixedSize(30, 25)
-        self.name_color_value = self.config_manager.get_global_setting('name_color', '#00ffff')
-        self.name_color_preview.setStyleSheet(f"background-color: {self.name_color_value}; border: 2px solid #333; border-radius: 3px;")
-        self.name_color_preview.setToolTip(f"Current name color: {self.name_color_value}")
+        self.name_color_value = cfg.get('name_color', '#00ffff')
+        self.name_color_preview = self._make_color_preview(self.name_color_value, "name color")
         self.color_layout.addWidget(self.name_color_preview)
 
         self.dialogue_color_label = QLabel("Dialogue Text:")
         self.dialogue_color_label.setToolTip("Color for dialogue/speech text")
         self.color_layout.addWidget(self.dialogue_color_label)
-        self.dialogue_color_button = QPushButton("Choose Color")
+        self.dialogue_color_button = QPushButton(_CHOOSE_COLOR_TEXT)
         self.dialogue_color_button.setToolTip("Click to pick a color for dialogue text")
-        self.dialogue_color_button.clicked.connect(lambda: self.pick_color('dialogue_color'))
+        self._color_mapper.setMapping(self.dialogue_color_button, 'dialogue_color')
+        self.dialogue_color_button.clicked.connect(self._color_mapper.map)
         self.color_layout.addWidget(self.dialogue_color_button)
-        self.dialogue_color_preview = QLabel()
-        self.dialogue_color_preview.setFixedSize(30, 25)
-        self.dialogue_color_value = self.config_manager.get_global_setting('dialogue_color', '#00ff00')
-        self.dialogue_color_preview.setStyleSheet(f"background-color: {self.dialogue_color_value}; border: 2px solid #333; border-radius: 3px;")
-        self.dialogue_color_preview.setToolTip(f"Current dialogue color: {self.dialogue_color_value}")
+        self.dialogue_color_value = cfg.get('dialogue_color', '#00ff00')
+        self.dialogue_color_preview = self._make_color_preview(self.dialogue_color_value, "dialogue color")
         self.color_layout.addWidget(self.dialogue_color_preview)
 
         # Background settings
         self.bg_group = QGroupBox("🖼️ Window Background")
-        self.bg_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.bg_group.setToolTip("Customize the translation window background and transparency")
         self.settings_layout.addWidget(self.bg_group)
         self.bg_layout = QHBoxLayout(self.bg_group)
@@ -459,31 +836,29 @@ class MainWindow(QMainWindow):
         self.bg_color_label = QLabel("Background Color:")
         self.bg_color_label.setToolTip("Color of the translation window background")
         self.bg_layout.addWidget(self.bg_color_label)
-        self.bg_color_button = QPushButton("Choose Color")
+        self.bg_color_button = QPushButton(_CHOOSE_COLOR_TEXT)
         self.bg_color_button.setToolTip("Click to pick a background color for translation windows")
         self.bg_color_button.clicked.connect(self.pick_background_color)
         self.bg_layout.addWidget(self.bg_color_button)
-        self.bg_color_preview = QLabel()
-        self.bg_color_preview.setFixedSize(30, 25)
-        self.bg_color_value = self.config_manager.get_background_color()
-        self.bg_color_preview.setStyleSheet(f"background-color: {self.bg_color_value}; border: 2px solid #333; border-radius: 3px;")
-        self.bg_color_preview.setToolTip(f"Current background color: {self.bg_color_value}")
+        self.bg_color_value = cfg.get('background_color', '#000000')
+        self.bg_color_preview = self._make_color_preview(self.bg_color_value, "background color")
         self.bg_layout.addWidget(self.bg_color_preview)
 
         self.opacity_label = QLabel("Transparency:")
         self.opacity_label.setToolTip("Window transparency (0.0 = fully transparent, 1.0 = fully opaque)")
         self.bg_layout.addWidget(self.opacity_label)
-        self.opacity_edit = QLineEdit()
-        self.opacity_edit.setFixedWidth(50)
-        self.opacity_edit.setText('0.85')
-        self.opacity_edit.setPlaceholderText("0.85")
-        self.opacity_edit.setToolTip("Enter opacity value between 0.1 and 1.0 (recommended: 0.7-0.9)")
-        self.opacity_edit.textChanged.connect(self.update_opacity)
-        self.bg_layout.addWidget(self.opacity_edit)
+        self.opacity_spin = QDoubleSpinBox()
+        self.opacity_spin.setFixedWidth(60)
+        self.opacity_spin.setRange(0.1, 1.0)
+        self.opacity_spin.setSingleStep(0.05)
+        self.opacity_spin.setDecimals(2)
+        self.opacity_spin.setValue(_OPACITY_DEFAULT)
+        self.opacity_spin.setToolTip("Opacity value between 0.1 and 1.0 (recommended: 0.7-0.9)")
+        self.opacity_spin.valueChanged.connect(self.update_opacity)
+        self.bg_layout.addWidget(self.opacity_spin)
 
         # Language settings
         self.language_group = QGroupBox("🌐 Translation Languages")
-        self.language_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.language_group.setToolTip("Select the source language (text to translate from) and target language (text to translate to)")
         self.settings_layout.addWidget(self.language_group)
         self.language_layout = QHBoxLayout(self.language_group)
@@ -505,73 +880,59 @@ class MainWindow(QMainWindow):
 
         # Hotkey settings
         self.hotkey_group = QGroupBox("⌨️ Keyboard Shortcuts")
-        self.hotkey_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.hotkey_group.setToolTip("Configure keyboard shortcuts for quick actions")
         self.settings_layout.addWidget(self.hotkey_group)
         self.hotkey_layout = QVBoxLayout(self.hotkey_group)
         self.hotkey_layout.setSpacing(8)
 
-        # Toggle Hotkey row
-        self.toggle_hotkey_layout = QHBoxLayout()
-        self.hotkey_label = QLabel("Pause/Resume Translation:")
-        self.hotkey_label.setToolTip("Hotkey to pause or resume translation in active windows")
-        self.toggle_hotkey_layout.addWidget(self.hotkey_label)
-        
-        # Use custom HotkeyInput widget instead of combobox
-        self.hotkey_input = HotkeyInput()
-        self.hotkey_input.setText(self.config_manager.get_toggle_hotkey())
-        self.hotkey_input.setToolTip("Click here and press your desired key combination (e.g., Ctrl+1)")
-        self.hotkey_input.textChanged.connect(self.on_hotkey_changed)
-        self.toggle_hotkey_layout.addWidget(self.hotkey_input)
-
-        self.hotkey_apply_button = QPushButton("Apply")
-        self.hotkey_apply_button.setToolTip("Click to save and activate the new hotkey")
-        self.hotkey_apply_button.clicked.connect(self.update_hotkey_setting)
-        self.hotkey_apply_button.setEnabled(False)
-        self.toggle_hotkey_layout.addWidget(self.hotkey_apply_button)
-
-        self.hotkey_info_label = QLabel("💡 Click field and press keys")
-        self.hotkey_info_label.setStyleSheet("color: #666666; font-size: 9pt; font-style: italic;")
-        self.hotkey_info_label.setToolTip("Instructions: Click the input field, then press your desired key combination")
-        self.toggle_hotkey_layout.addWidget(self.hotkey_info_label)
-        
-        # Store the original hotkey for comparison
-        self.original_hotkey = self.config_manager.get_toggle_hotkey()
-        
-        self.hotkey_layout.addLayout(self.toggle_hotkey_layout)
-
-        # Add Area hotkey settings (below Toggle Hotkey)
-        self.add_area_hotkey_layout = QHBoxLayout()
-        self.add_area_hotkey_label = QLabel("Add New Area:")
-        self.add_area_hotkey_label.setToolTip("Hotkey to quickly add a new translation area")
-        self.add_area_hotkey_layout.addWidget(self.add_area_hotkey_label)
-        
-        # Use custom HotkeyInput widget for add area hotkey
-        self.add_area_hotkey_input = HotkeyInput()
-        self.add_area_hotkey_input.setText(self.config_manager.get_add_area_hotkey())
-        self.add_area_hotkey_input.setToolTip("Click here and press your desired key combination (e.g., Ctrl+2)")
-        self.add_area_hotkey_input.textChanged.connect(self.on_add_area_hotkey_changed)
-        self.add_area_hotkey_layout.addWidget(self.add_area_hotkey_input)
-
-        self.add_area_hotkey_apply_button = QPushButton("Apply")
-        self.add_area_hotkey_apply_button.setToolTip("Click to save and activate the new hotkey")
-        self.add_area_hotkey_apply_button.clicked.connect(self.update_add_area_hotkey_setting)
-        self.add_area_hotkey_apply_button.setEnabled(False)
-        self.add_area_hotkey_layout.addWidget(self.add_area_hotkey_apply_button)
-
-        self.add_area_hotkey_info_label = QLabel("💡 Click field and press keys")
-        self.add_area_hotkey_info_label.setStyleSheet("color: #666666; font-size: 9pt; font-style: italic;")
-        self.add_area_hotkey_info_label.setToolTip("Instructions: Click the input field, then press your desired key combination")
-        self.add_area_hotkey_layout.addWidget(self.add_area_hotkey_info_label)
-        
-        # Store the original add area hotkey for comparison
-        self.original_add_area_hotkey = self.config_manager.get_add_area_hotkey()
-        
-        self.hotkey_layout.addLayout(self.add_area_hotkey_layout)
+        # Hotkey edits are checked for changes once per burst of key presses
+        self._hotkey_timer = QTimer(self)
+        self._hotkey_timer.setSingleShot(True)
+        self._hotkey_timer.timeout.connect(self._refresh_hotkey_apply_button)
+        self._add_area_hotkey_timer = QTimer(self)
+        self._add_area_hotkey_timer.setSingleShot(True)
+        self._add_area_hotkey_timer.timeout.connect(self._refresh_add_area_hotkey_apply_button)
+
+        # Hotkey rows are built and wired from _HOTKEY_ROWS
+        for (prefix, layout_attr, label_text, label_tip, key, default,
+             input_tip, changed_slot, apply_slot) in _HOTKEY_ROWS:
+            row_layout = QHBoxLayout()
+            setattr(self, layout_attr, row_layout)
+
+            label = QLabel(label_text)
+            label.setToolTip(label_tip)
+            row_layout.addWidget(label)
+            setattr(self, f'{prefix}hotkey_label', label)
+
+            # Use custom HotkeyInput widget instead of combobox
+            hotkey = cfg.get(key, default)
+            hotkey_input = HotkeyInput()
+            hotkey_input.setText(hotkey)
+            hotkey_input.setToolTip(input_tip)
+            hotkey_input.textChanged.connect(getattr(self, changed_slot))
+            row_layout.addWidget(hotkey_input)
+            setattr(self, f'{prefix}hotkey_input', hotkey_input)
+
+            apply_button = QPushButton("Apply")
+            apply_button.setToolTip(_HOTKEY_APPLY_TOOLTIP)
+            apply_button.clicked.connect(getattr(self, apply_slot))
+            apply_button.setEnabled(False)
+            row_layout.addWidget(apply_button)
+            setattr(self, f'{prefix}hotkey_apply_button', apply_button)
+
+            info_label = QLabel(_HOTKEY_INFO_TEXT)
+            info_label.setStyleSheet(_INFO_LABEL_STYLE)
+            info_label.setToolTip(_HOTKEY_INFO_TOOLTIP)
+            row_layout.addWidget(info_label)
+            setattr(self, f'{prefix}hotkey_info_label', info_label)
+
+            # Store the original hotkey for comparison
+            setattr(self, f'original_{prefix}hotkey', hotkey)
+
+            self.hotkey_layout.addLayout(row_layout)
 
         # Auto-pause settings
         self.auto_pause_group = QGroupBox("⏸️ Smart Pause (Resource Saving)")
-        self.auto_pause_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.auto_pause_group.setToolTip("Automatically pause translation when no text is detected to save resources")
         self.settings_layout.addWidget(self.auto_pause_group)
         self.auto_pause_layout = QHBoxLayout(self.auto_pause_group)
@@ -597,14 +958,13 @@ class MainWindow(QMainWindow):
         self.auto_pause_layout.addWidget(self.auto_pause_label)
 
         self.auto_pause_info_label = QLabel("💡 Saves resources")
-        self.auto_pause_info_label.setStyleSheet("color: #666666; font-size: 9pt; font-style: italic;")
+        self.auto_pause_info_label.setStyleSheet(_INFO_LABEL_STYLE)
         self.auto_pause_info_label.setToolTip("Saves API calls in Google Cloud mode, saves CPU resources in Local mode")
         self.auto_pause_layout.addWidget(self.auto_pause_info_label)
         self.auto_pause_layout.addStretch()
 
         # Translation mode settings
         self.translation_mode_group = QGroupBox("⚙️ Translation Service")
-        self.translation_mode_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.translation_mode_group.setToolTip("Choose your translation service: Google Cloud (paid), Local (free, requires LM Studio), or LibreTranslate (free, self-hosted)")
         self.settings_layout.addWidget(self.translation_mode_group)
         self.translation_mode_layout = QVBoxLayout(self.translation_mode_group)
@@ -616,158 +976,32 @@ class MainWindow(QMainWindow):
         self.mode_label.setToolTip("Select the translation service to use")
         self.mode_layout.addWidget(self.mode_label)
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["Google Cloud", "Local (Tesseract + LM Studio)", "LibreTranslate (Tesseract + LibreTranslate)"])
-        current_mode = self.config_manager.get_translation_mode()
-        if current_mode == 'google':
-            mode_index = 0
-        elif current_mode == 'local':
-            mode_index = 1
-        else:  # libretranslate
-            mode_index = 2
-        self.mode_combo.setCurrentIndex(mode_index)
+        self.mode_combo.addItems(_MODE_LABELS)
+        self.mode_combo.setCurrentIndex(_MODE_INDEX.get(cfg.get('translation_mode', 'google'), 0))
         self.mode_combo.setToolTip("Google Cloud: Paid, high quality\nLocal: Free, requires LM Studio running\nLibreTranslate: Free, requires LibreTranslate server")
         self.mode_combo.currentIndexChanged.connect(self.on_translation_mode_changed)
         self.mode_layout.addWidget(self.mode_combo)
         self.mode_layout.addStretch()  # Add stretch to align left
         self.translation_mode_layout.addLayout(self.mode_layout)
 
-        # LLM Studio settings (shown only when local mode is selected)
-        self.llm_studio_group = QGroupBox("🤖 LM Studio Configuration")
-        self.llm_studio_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
-        self.llm_studio_group.setToolTip("Configure LM Studio API connection for local translation")
-        self.translation_mode_layout.addWidget(self.llm_studio_group)
-        self.llm_studio_layout = QVBoxLayout(self.llm_studio_group)
-        self.llm_studio_layout.setSpacing(8)
-
-        # API URL setting
-        self.llm_studio_url_layout = QHBoxLayout()
-        self.llm_studio_url_label = QLabel("API URL:")
-        self.llm_studio_url_label.setToolTip("LM Studio API endpoint URL")
-        self.llm_studio_url_layout.addWidget(self.llm_studio_url_label)
-        self.llm_studio_edit = QLineEdit()
-        self.llm_studio_edit.setText(self.config_manager.get_llm_studio_url())
-        self.llm_studio_edit.setPlaceholderText("http://localhost:1234/v1")
-        self.llm_studio_edit.setToolTip("Enter LM Studio API URL (default: http://localhost:1234/v1)\nMake sure LM Studio is running with API enabled")
-        self.llm_studio_edit.textChanged.connect(self.on_llm_studio_url_changed)
-        self.llm_studio_url_layout.addWidget(self.llm_studio_edit)
-        self.llm_studio_layout.addLayout(self.llm_studio_url_layout)
-
-        # Model name setting
-        self.llm_studio_model_layout = QHBoxLayout()
-        self.llm_studio_model_label = QLabel("Model Name:")
-        self.llm_studio_model_label.setToolTip("Specific model to use (optional)")
-        self.llm_studio_model_layout.addWidget(self.llm_studio_model_label)
-        self.llm_studio_model_edit = QLineEdit()
-        self.llm_studio_model_edit.setPlaceholderText("Leave empty for auto-detect")
-        self.llm_studio_model_edit.setText(self.config_manager.get_llm_studio_model())
-        self.llm_studio_model_edit.setToolTip("Enter a specific model name, or leave empty to auto-detect from LM Studio")
-        self.llm_studio_model_edit.textChanged.connect(self.on_llm_studio_model_changed)
-        self.llm_studio_model_layout.addWidget(self.llm_studio_model_edit)
-        self.llm_studio_layout.addLayout(self.llm_studio_model_layout)
-
-        # OCR mode setting
-        self.ocr_mode_layout = QHBoxLayout()
-        self.ocr_mode_label = QLabel("Text Detection (OCR):")
-        self.ocr_mode_label.setToolTip("OCR engine for detecting text from screen")
-        self.ocr_mode_layout.addWidget(self.ocr_mode_label)
-        self.ocr_mode_combo = QComboBox()
-        self.ocr_mode_combo.addItems(["Tesseract OCR", "PaddleOCR"])
-        current_ocr_mode = self.config_manager.get_ocr_mode()
-        self.ocr_mode_combo.setCurrentIndex(0 if current_ocr_mode == 'tesseract' else 1)
-        self.ocr_mode_combo.setToolTip("Tesseract: Free, widely available\nPaddleOCR: Better accuracy, requires installation")
+        # One OCR/Tesseract panel, moved into whichever provider group is active
+        self.ocr_tess_panel = OcrTesseractPanel(cfg.get('ocr_mode', 'tesseract'), cfg.get('tesseract_path', ''))
+        self.ocr_mode_combo = self.ocr_tess_panel.ocr_mode_combo
         self.ocr_mode_combo.currentIndexChanged.connect(self.on_ocr_mode_changed)
-        self.ocr_mode_layout.addWidget(self.ocr_mode_combo)
-        self.llm_studio_layout.addLayout(self.ocr_mode_layout)
-
-        # Tesseract path setting
-        self.tesseract_path_layout = QHBoxLayout()
-        self.tesseract_path_label = QLabel("Tesseract Path:")
-        self.tesseract_path_label.setToolTip("Path to tesseract.exe (leave empty if Tesseract is in system PATH)")
-        self.tesseract_path_layout.addWidget(self.tesseract_path_label)
-        self.tesseract_path_edit = QLineEdit()
-        self.tesseract_path_edit.setPlaceholderText("Leave empty to use system PATH")
-        self.tesseract_path_edit.setText(self.config_manager.get_tesseract_path())
-        self.tesseract_path_edit.setToolTip("Enter full path to tesseract.exe, or leave empty if Tesseract is installed and in your system PATH")
-        self.tesseract_path_edit.textChanged.connect(self.on_tesseract_path_changed)
-        self.tesseract_path_layout.addWidget(self.tesseract_path_edit)
-        self.tesseract_browse_button = QPushButton("Browse...")
-        self.tesseract_browse_button.setToolTip("Browse for tesseract.exe file")
-        self.tesseract_browse_button.clicked.connect(self.browse_tesseract_path)
-        self.tesseract_path_layout.addWidget(self.tesseract_browse_button)
-        
-        self.tesseract_test_button = QPushButton("Test")
-        self.tesseract_test_button.setToolTip("Test if Tesseract is installed and working correctly")
-        self.tesseract_test_button.clicked.connect(self.test_tesseract)
-        self.tesseract_path_layout.addWidget(self.tesseract_test_button)
-        self.llm_studio_layout.addLayout(self.tesseract_path_layout)
-
-        # LibreTranslate settings (shown only when libretranslate mode is selected)
-        self.libretranslate_group = QGroupBox("🌍 LibreTranslate Configuration")
-        self.libretranslate_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
-        self.libretranslate_group.setToolTip("Configure LibreTranslate API connection (free, open-source translation service)")
-        self.translation_mode_layout.addWidget(self.libretranslate_group)
-        self.libretranslate_layout = QVBoxLayout(self.libretranslate_group)
-        self.libretranslate_layout.setSpacing(8)
-
-        # API URL setting
-        self.libretranslate_url_layout = QHBoxLayout()
-        self.libretranslate_url_label = QLabel("API URL:")
-        self.libretranslate_url_label.setToolTip("LibreTranslate server API endpoint")
-        self.libretranslate_url_layout.addWidget(self.libretranslate_url_label)
-        self.libretranslate_edit = QLineEdit()
-        self.libretranslate_edit.setText(self.config_manager.get_libretranslate_url())
-        self.libretranslate_edit.setPlaceholderText("http://localhost:5000")
-        self.libretranslate_edit.setToolTip("Enter LibreTranslate API URL (default: http://localhost:5000)\nMake sure LibreTranslate server is running")
-        self.libretranslate_edit.textChanged.connect(self.on_libretranslate_url_changed)
-        self.libretranslate_url_layout.addWidget(self.libretranslate_edit)
-        
-        # Test connection button (inline with API URL)
-        self.libretranslate_test_button = QPushButton("Test Connection")
-        self.libretranslate_test_button.setToolTip("Test if LibreTranslate API is accessible and working")
-        self.libretranslate_test_button.clicked.connect(self.test_libretranslate)
-        self.libretranslate_url_layout.addWidget(self.libretranslate_test_button)
-        
-        self.libretranslate_layout.addLayout(self.libretranslate_url_layout)
-
-        # OCR mode setting for LibreTranslate
-        self.libretranslate_ocr_mode_layout = QHBoxLayout()
-        self.libretranslate_ocr_mode_label = QLabel("Text Detection (OCR):")
-        self.libretranslate_ocr_mode_label.setToolTip("OCR engine for detecting text from screen")
-        self.libretranslate_ocr_mode_layout.addWidget(self.libretranslate_ocr_mode_label)
-        self.libretranslate_ocr_mode_combo = QComboBox()
-        self.libretranslate_ocr_mode_combo.addItems(["Tesseract OCR", "PaddleOCR"])
-        current_ocr_mode = self.config_manager.get_ocr_mode()
-        self.libretranslate_ocr_mode_combo.setCurrentIndex(0 if current_ocr_mode == 'tesseract' else 1)
-        self.libretranslate_ocr_mode_combo.setToolTip("Tesseract: Free, widely available\nPaddleOCR: Better accuracy, requires installation")
-        self.libretranslate_ocr_mode_combo.currentIndexChanged.connect(self.on_ocr_mode_changed)
-        self.libretranslate_ocr_mode_layout.addWidget(self.libretranslate_ocr_mode_combo)
-        self.libretranslate_layout.addLayout(self.libretranslate_ocr_mode_layout)
-
-        # Tesseract path setting for LibreTranslate
-        self.libretranslate_tesseract_path_layout = QHBoxLayout()
-        self.libretranslate_tesseract_path_label = QLabel("Tesseract Path:")
-        self.libretranslate_tesseract_path_label.setToolTip("Path to tesseract.exe (leave empty if Tesseract is in system PATH)")
-        self.libretranslate_tesseract_path_layout.addWidget(self.libretranslate_tesseract_path_label)
-        self.libretranslate_tesseract_path_edit = QLineEdit()
-        self.libretranslate_tesseract_path_edit.setPlaceholderText("Leave empty to use system PATH")
-        self.libretranslate_tesseract_path_edit.setText(self.config_manager.get_tesseract_path())
-        self.libretranslate_tesseract_path_edit.setToolTip("Enter full path to tesseract.exe, or leave empty if Tesseract is installed and in your system PATH")
-        self.libretranslate_tesseract_path_edit.textChanged.connect(self.on_tesseract_path_changed)
-        self.libretranslate_tesseract_path_layout.addWidget(self.libretranslate_tesseract_path_edit)
-        self.libretranslate_tesseract_browse_button = QPushButton("Browse...")
-        self.libretranslate_tesseract_browse_button.setToolTip("Browse for tesseract.exe file")
-        self.libretranslate_tesseract_browse_button.clicked.connect(self.browse_tesseract_path)
-        self.libretranslate_tesseract_path_layout.addWidget(self.libretranslate_tesseract_browse_button)
-        
-        self.libretranslate_tesseract_test_button = QPushButton("Test")
-        self.libretranslate_tesseract_test_button.setToolTip("Test if Tesseract is installed and working correctly")
-        self.libretranslate_tesseract_test_button.clicked.connect(self.test_tesseract)
-        self.libretranslate_tesseract_path_layout.addWidget(self.libretranslate_tesseract_test_button)
-        self.libretranslate_layout.addLayout(self.libretranslate_tesseract_path_layout)
+        self.ocr_tess_panel.tesseract_path_changed.connect(self.on_tesseract_path_changed)
+        self.ocr_tess_panel.tesseract_browse_clicked.connect(self.browse_tesseract_path)
+        self.ocr_tess_panel.tesseract_test_clicked.connect(self.test_tesseract)
+
+        # Provider groups are built on first selection of their mode
+        self._provider_builders = {mode: partial(self._build_provider_group, mode) for mode in _PROVIDER_GROUPS}
+        self._provider_groups = {}
+        # They share one stack, so only the active group takes part in layout
+        self._provider_stack = QStackedWidget()
+        self.translation_mode_layout.addWidget(self._provider_stack)
+        self._provider_page_index: Dict[str, int] = {}
 
         # Credentials settings
         self.credentials_group = QGroupBox("☁️ Google Cloud Credentials")
-        self.credentials_group.setStyleSheet(f"background-color: {self.frame_bg}; padding-top: 8px;")
         self.credentials_group.setToolTip("Configure Google Cloud Translation API credentials (JSON file)")
         self.settings_layout.addWidget(self.credentials_group)
         self.credentials_layout = QHBoxLayout(self.credentials_group)
@@ -777,7 +1011,8 @@ class MainWindow(QMainWindow):
         self.credentials_label.setToolTip("Path to Google Cloud service account JSON file")
         self.credentials_layout.addWidget(self.credentials_label)
         self.credentials_edit = QLineEdit()
-        self.credentials_edit.setText(self.config_manager.get_credentials_path())
+        self.credentials_edit.setText(cfg.get('credentials_path', ''))
+        self.credentials_edit.setInputMethodHints(_RAW_TEXT_HINTS)
         self.credentials_edit.setPlaceholderText("Select Google Cloud credentials JSON file...")
         self.credentials_edit.setToolTip("Path to your Google Cloud service account JSON credentials file\nYou can download this from Google Cloud Console")
         self.credentials_layout.addWidget(self.credentials_edit)
@@ -786,56 +1021,86 @@ class MainWindow(QMainWindow):
         self.browse_button.clicked.connect(self.browse_credentials)
         self.credentials_layout.addWidget(self.browse_button)
 
-        # Translation areas panel
-        self.areas_group = QGroupBox("📍 Translation Areas")
-        self.areas_group.setStyleSheet(
-            f"QGroupBox {{ font: 10pt 'Google Sans'; color: {self.text_color}; background-color: {self.frame_bg}; padding-top: 10px; }}"
-            f"QGroupBox::title {{ subcontrol-origin: margin; left: 10px; padding: 0 5px; }}"
+        # Controls enabled and disabled together by update_settings_state
+        self._toggleable_widgets = (
+            self.font_combo, self.font_size_edit, self.font_style_combo,
+            self.name_color_button, self.dialogue_color_button,
+            self.bg_color_button, self.opacity_spin,
+            self.source_lang_combo, self.target_lang_combo,
+            self.hotkey_input, self.add_area_hotkey_input,
+            self.auto_pause_checkbox, self.auto_pause_threshold_spinbox,
+            self.credentials_group, self.mode_combo, self.ocr_tess_panel,
         )
-        self.areas_group.setToolTip("Manage your translation areas. Each area monitors a specific screen region for text to translate.")
-        self.main_layout.addWidget(self.areas_group)
-        self.areas_layout = QVBoxLayout(self.areas_group)
-        self.areas_layout.setSpacing(10)
-        self.areas_layout.setContentsMargins(10, 15, 10, 10)
-
-        self.areas_tree = QTreeWidget()
-        self.areas_tree.setHeaderLabels(["Name", "Position", "Size", "Action"])
-        self.areas_tree.setStyleSheet(f"background-color: {self.frame_bg};")
-        self.areas_tree.setColumnWidth(3, 80)  # Set Action column width for icon buttons (Start/Stop + Delete)
-        self.areas_tree.setToolTip("List of all translation areas. Use ▶ to start/stop translation, ✕ to delete.")
-        self.areas_layout.addWidget(self.areas_tree)
-
-        self.buttons_layout = QHBoxLayout()
-        self.areas_layout.addLayout(self.buttons_layout)
-
-        self.add_button = QPushButton("➕ Add New Area")
-        self.add_button.setToolTip("Add a new translation area by selecting a region on your screen\nYou can also use the 'Add Area' hotkey for quick access")
-        self.add_button.clicked.connect(self.add_area)
-        self.buttons_layout.addWidget(self.add_button)
 
         # Styling buttons
-        for btn in [self.add_button, self.browse_button,
-                    self.name_color_button, self.dialogue_color_button, self.bg_color_button, 
-                    self.hotkey_apply_button, self.add_area_hotkey_apply_button,
-                    self.tesseract_browse_button, self.tesseract_test_button,
-                    self.libretranslate_test_button, self.libretranslate_tesseract_browse_button,
-                    self.libretranslate_tesseract_test_button]:
-            btn.setStyleSheet(
-                f"QPushButton {{ background-color: {self.button_bg}; color: {self.button_fg}; padding: 6px 12px; border-radius: 4px; font-weight: 500; }}"
-                f"QPushButton:hover {{ background-color: {self.secondary_color}; }}"
-                f"QPushButton:disabled {{ background-color: #cccccc; color: #666666; }}"
-            )
+        self._apply_button_style(self.browse_button,
+                                 self.name_color_button, self.dialogue_color_button, self.bg_color_button,
+                                 self.hotkey_apply_button, self.add_area_hotkey_apply_button)
         
         # Show/hide credentials group based on mode
         self.on_translation_mode_changed()
         
         # Initialize Tesseract path field visibility based on OCR mode
         self.on_ocr_mode_changed()
+        self._settings_built = True
+
+    def _build_provider_group(self, mode: str, cfg):
+        """Build the configuration group for mode from its _PROVIDER_GROUPS entry."""
+        prefix, title, group_tip, fields, test_button = _PROVIDER_GROUPS[mode]
+        group = QGroupBox(title)
+        group.setToolTip(group_tip)
+        group.setEnabled(self._settings_enabled is not False)
+        self._provider_page_index[mode] = self._provider_stack.addWidget(group)
+        layout = QVBoxLayout(group)
+        layout.setSpacing(8)
+        setattr(self, f'{prefix}_group', group)
+        setattr(self, f'{prefix}_layout', layout)
+
+        for index, (widget_attr, label_text, label_tip, key, default, placeholder,
+                    widget_tip, allow_empty) in enumerate(fields):
+            row_layout = QHBoxLayout()
+            label = QLabel(label_text)
+            label.setToolTip(label_tip)
+            row_layout.addWidget(label)
+            edit = QLineEdit()
+            edit.setText(cfg.get(key, default))
+            edit.setPlaceholderText(placeholder)
+            edit.setToolTip(widget_tip)
+            edit.setInputMethodHints(_RAW_TEXT_HINTS)
+            edit.textChanged.connect(partial(self._on_provider_field_changed, key, allow_empty))
+            row_layout.addWidget(edit)
+            setattr(self, widget_attr, edit)
+            layout.addLayout(row_layout)
+
+            # Test connection button (inline with the first row)
+            if test_button and index == 0:
+                button_attr, button_text, button_tip, slot = test_button
+                button = QPushButton(button_text)
+                button.setToolTip(button_tip)
+                button.clicked.connect(getattr(self, slot))
+                row_layout.addWidget(button)
+                self._apply_button_style(button)
+                setattr(self, button_attr, button)
+
+        return group
+
+    def _ensure_provider_group(self, mode: str) -> Optional[QGroupBox]:
+        """Return the configuration group for mode, building it on first use."""
+        group = self._provider_groups.get(mode)
+        builder = self._provider_builders.get(mode)
+        if group is None and builder:
+            # The window is usually visible here; repaint once after the whole group exists
+            self.translation_mode_group.setUpdatesEnabled(False)
+            try:
+                group = self._provider_groups[mode] = builder(self.config_manager.snapshot())
+            finally:
+                self.translation_mode_group.setUpdatesEnabled(True)
+        return group
 
-        # Translation windows
-        self.area_selected = False
-        self.language_code_to_name = {}
-        self.language_name_to_code = {}
+    def _apply_button_style(self, *buttons):
+        """Apply the shared accent style to buttons."""
+        for btn in buttons:
+            btn.setObjectName("AccentButton")
 
     def load_saved_areas(self):
         """Load saved areas from configuration."""
@@ -843,20 +1108,27 @@ class MainWindow(QMainWindow):
             logger.info("Loading saved areas...")
             areas = self.config_manager.get_all_areas()
             logger.info(f"Found {len(areas)} saved areas")
-            self.areas_tree.clear()
-            if areas:
+            # Rebuild the tree in one batch so it re-lays out once, not per row
+            self.areas_tree.setUpdatesEnabled(False)
+            self.areas_tree.blockSignals(True)
+            try:
+                self.areas_tree.clear()
+                self._area_items.clear()
+                self._action_buttons.clear()
+                items = []
                 for area_id, area_data in areas.items():
-                    logger.info(f"Loading area {area_id}: {area_data}")
-                    item = QTreeWidgetItem([
-                        f"Area {area_id}",
-                        f"X: {area_data['x']}, Y: {area_data['y']}",
-                        f"W: {area_data['width']}, H: {area_data['height']}",
-                        ""  # Empty for Action column, will be filled with button
-                    ])
-                    item.setData(0, Qt.UserRole, area_id)
-                    self.areas_tree.addTopLevelItem(item)
-                    # Add action button for this area
+                    # ConfigManager already logs each area; only format this when debugging
+                    logger.debug("Loading area %s: %s", area_id, area_data)
+                    item = _make_area_item(area_id, area_data['x'], area_data['y'],
+                                           area_data['width'], area_data['height'])
+                    items.append((item, area_id))
+                self.areas_tree.addTopLevelItems([item for item, _ in items])
+                # Item widgets can only be attached once the items are in the tree
+                for item, area_id in items:
                     self._add_action_button(item, area_id)
+            finally:
+                self.areas_tree.blockSignals(False)
+                self.areas_tree.setUpdatesEnabled(True)
             self.area_selected = self.areas_tree.topLevelItemCount() > 0
             self.update_button_states()
             logger.info("Areas loaded successfully")
@@ -865,13 +1137,7 @@ class MainWindow(QMainWindow):
 
     def _add_action_button(self, item: QTreeWidgetItem, area_id: str):
         """Add Start/Stop and Delete buttons to the Action column for a tree item."""
-        # Check if translation is running for this area
-        is_running = False
-        if hasattr(self, 'translation_windows') and area_id in self.translation_windows:
-            window = self.translation_windows[area_id]
-            is_running = window.isVisible() and \
-                        hasattr(window, 'is_capturing') and \
-                        window.is_capturing
+        is_running = self._is_area_running(area_id)
         
         # Create container widget for action buttons
         action_container = QWidget()
@@ -880,37 +1146,30 @@ class MainWindow(QMainWindow):
         action_layout.setSpacing(3)
         
         # Create Start/Stop button with icon
-        start_stop_button = QPushButton("⏸" if is_running else "▶")
+        start_stop_button = QToolButton()
+        start_stop_button.setText("⏸" if is_running else "▶")
         start_stop_button.setFixedSize(28, 25)
         start_stop_button.setToolTip("Stop" if is_running else "Start")
         
-        # Style the Start/Stop button
-        if is_running:
-            start_stop_button.setStyleSheet(
-                f"QPushButton {{ background-color: #f44336; color: white; padding: 3px; border-radius: 3px; font-size: 14px; }}"
-                f"QPushButton:hover {{ background-color: #d32f2f; }}"
-            )
-        else:
-            start_stop_button.setStyleSheet(
-                f"QPushButton {{ background-color: {self.button_bg}; color: {self.button_fg}; padding: 3px; border-radius: 3px; font-size: 14px; }}"
-                f"QPushButton:hover {{ background-color: {self.secondary_color}; }}"
-            )
+        # Style the Start/Stop button through the window stylesheet
+        start_stop_button.setObjectName("ActionButton")
+        start_stop_button.setProperty("running", is_running)
         
         # Connect Start/Stop button to toggle action
-        start_stop_button.clicked.connect(lambda checked, aid=area_id: self._toggle_area_translation(aid))
+        self._toggle_mapper.setMapping(start_stop_button, area_id)
+        start_stop_button.clicked.connect(self._toggle_mapper.map)
         action_layout.addWidget(start_stop_button)
         
         # Create Delete button with icon
-        delete_button = QPushButton("✕")
+        delete_button = QToolButton()
+        delete_button.setText("✕")
         delete_button.setFixedSize(28, 25)
         delete_button.setToolTip("Delete")
-        delete_button.setStyleSheet(
-            f"QPushButton {{ background-color: #f44336; color: white; padding: 3px; border-radius: 3px; font-size: 14px; }}"
-            f"QPushButton:hover {{ background-color: #d32f2f; }}"
-        )
+        delete_button.setObjectName("DeleteButton")
         
         # Connect Delete button to delete action
-        delete_button.clicked.connect(lambda checked, aid=area_id: self._delete_area_by_id(aid))
+        self._delete_mapper.setMapping(delete_button, area_id)
+        delete_button.clicked.connect(self._delete_mapper.map)
         action_layout.addWidget(delete_button)
         
         # Add stretch to align buttons to the left
@@ -919,71 +1178,37 @@ class MainWindow(QMainWindow):
         # Set container widget in the Action column (column 3)
         self.areas_tree.setItemWidget(item, 3, action_container)
         
-        # Store button references in item data
-        item.setData(3, Qt.UserRole, {'start_stop': start_stop_button, 'delete': delete_button, 'container': action_container})
+        self._area_items[area_id] = item
+        self._action_buttons[area_id] = start_stop_button
 
     def _update_action_button(self, area_id: str, running: bool):
         """Update the action button state for a specific area."""
-        # Find the tree item for this area
-        for i in range(self.areas_tree.topLevelItemCount()):
-            item = self.areas_tree.topLevelItem(i)
-            if item.data(0, Qt.UserRole) == area_id:
-                # Get button container or create it
-                container = self.areas_tree.itemWidget(item, 3)
-                if container is None:
-                    # Container doesn't exist, create it
-                    self._add_action_button(item, area_id)
-                    container = self.areas_tree.itemWidget(item, 3)
-                
-                if container:
-                    # Get button references from item data or container
-                    button_data = item.data(3, Qt.UserRole)
-                    if button_data and isinstance(button_data, dict):
-                        start_stop_button = button_data.get('start_stop')
-                    else:
-                        # Fallback: find button in container layout
-                        layout = container.layout()
-                        if layout and layout.count() > 0:
-                            start_stop_button = layout.itemAt(0).widget()
-                        else:
-                            start_stop_button = None
-                    
-                    if start_stop_button:
-                        # Update Start/Stop button icon and style
-                        start_stop_button.setText("⏸" if running else "▶")
-                        start_stop_button.setToolTip("Stop" if running else "Start")
-                        if running:
-                            start_stop_button.setStyleSheet(
-                                f"QPushButton {{ background-color: #f44336; color: white; padding: 3px; border-radius: 3px; font-size: 14px; }}"
-                                f"QPushButton:hover {{ background-color: #d32f2f; }}"
-                            )
-                        else:
-                            start_stop_button.setStyleSheet(
-                                f"QPushButton {{ background-color: {self.button_bg}; color: {self.button_fg}; padding: 3px; border-radius: 3px; font-size: 14px; }}"
-                                f"QPushButton:hover {{ background-color: {self.secondary_color}; }}"
-                            )
-                break
+        start_stop_button = self._action_buttons.get(area_id)
+        if start_stop_button is None:
+            return
+        # Update Start/Stop button icon and style
+        start_stop_button.setText("⏸" if running else "▶")
+        start_stop_button.setToolTip("Stop" if running else "Start")
+        start_stop_button.setProperty("running", running)
+        # Re-polish so the [running] rule is re-evaluated
+        style = start_stop_button.style()
+        style.unpolish(start_stop_button)
+        style.polish(start_stop_button)
+
+    def _is_area_running(self, area_id: str) -> bool:
+        """Check if the translation window for area_id is visible and capturing."""
+        window = self.translation_windows.get(area_id)
+        # The capture flag is a plain attribute, so test it before asking Qt
+        return window is not None and window.is_capturing and window.isVisible()
 
     def _has_running_translation_windows(self) -> bool:
         """Check if any translation windows are currently running (visible and capturing)."""
-        if not hasattr(self, 'translation_windows') or not self.translation_windows:
-            return False
-        for area_id, window in self.translation_windows.items():
-            if window.isVisible() and hasattr(window, 'is_capturing') and window.is_capturing:
-                return True
-        return False
+        return any(window.is_capturing and window.isVisible()
+                   for window in self.translation_windows.values())
 
     def _toggle_area_translation(self, area_id: str):
         """Toggle translation for a specific area (start or stop)."""
-        # Check if translation is currently running
-        is_running = False
-        if hasattr(self, 'translation_windows') and area_id in self.translation_windows:
-            window = self.translation_windows[area_id]
-            is_running = window.isVisible() and \
-                        hasattr(window, 'is_capturing') and \
-                        window.is_capturing
-        
-        if is_running:
+        if self._is_area_running(area_id):
             # Stop translation
             self._stop_area_translation(area_id)
         else:
@@ -992,15 +1217,19 @@ class MainWindow(QMainWindow):
 
     def _start_area_translation(self, area_id: str):
         """Start translation for a specific area by ID."""
-        # Find the tree item for this area
-        for i in range(self.areas_tree.topLevelItemCount()):
-            item = self.areas_tree.topLevelItem(i)
-            if item.data(0, Qt.UserRole) == area_id:
-                # Select the item temporarily
-                self.areas_tree.setCurrentItem(item)
-                # Start translation using existing method
-                self.start_translation()
-                break
+        if area_id in self._area_items:
+            self.start_translation(area_id)
+
+    def _start_ocr_warmup(self):
+        """Load PaddleOCR in the background if the next captures will need it."""
+        if self.ocr_warmup_thread is not None or self.text_processor is None:
+            return
+        if (self.config_manager.get_translation_mode() in ('local', 'libretranslate')
+                and self.config_manager.get_ocr_mode() == 'paddleocr'):
+            # Gets the load under way before the first capture tick; a tick that arrives
+            # mid-load still waits on the UI thread for the rest of it
+            self.ocr_warmup_thread = OcrWarmupThread(self.text_processor)
+            self.ocr_warmup_thread.start()
 
     def _stop_area_translation(self, area_id: str):
         """Stop translation for a specific area by ID."""
@@ -1008,13 +1237,10 @@ class MainWindow(QMainWindow):
             if area_id in self.translation_windows:
                 window = self.translation_windows[area_id]
                 # Stop capturing
-                if hasattr(window, 'is_capturing'):
-                    window.is_capturing = False
-                if hasattr(window, 'toggle_capture'):
-                    window.toggle_capture()
+                window.is_capturing = False
+                window.toggle_capture()
                 # Stop the timer
-                if hasattr(window, 'timer') and window.timer:
-                    window.timer.stop()
+                window.timer.stop()
                 # Hide the window
                 window.hide()
                 
@@ -1038,36 +1264,25 @@ class MainWindow(QMainWindow):
             screenshot, region = capture_screen_region()
             if region:
                 x, y, w, h = region
-                # Get existing area IDs
-                existing_ids = set()
-                for i in range(self.areas_tree.topLevelItemCount()):
-                    item = self.areas_tree.topLevelItem(i)
-                    existing_ids.add(int(item.data(0, Qt.UserRole)))
-                
-                # Find the next available ID
-                new_id = 1
-                while new_id in existing_ids:
-                    new_id += 1
-                
-                area_id = str(new_id)
-                item = QTreeWidgetItem([
-                    f"Area {area_id}",
-                    f"X: {x}, Y: {y}",
-                    f"W: {w}, H: {h}",
-                    ""  # Empty for Action column, will be filled with button
-                ])
-                item.setData(0, Qt.UserRole, area_id)
-                self.areas_tree.addTopLevelItem(item)
-                # Add action button for this area
-                self._add_action_button(item, area_id)
+                # Lowest free ID, probed directly against the ID-to-row map
+                area_id = next(str(i) for i in itertools.count(1) if str(i) not in self._area_items)
+                item = _make_area_item(area_id, x, y, w, h)
+                # Insert, attach the action widgets and select in one repaint
+                self.areas_tree.setUpdatesEnabled(False)
+                try:
+                    self.areas_tree.addTopLevelItem(item)
+                    self._add_action_button(item, area_id)
+                    # Select the newly added area
+                    self.areas_tree.setCurrentItem(item)
+                finally:
+                    self.areas_tree.setUpdatesEnabled(True)
                 self.save_area_config(area_id, x, y, w, h)
                 self.area_selected = True
                 self.update_button_states()
                 
-                # Select the newly added area and automatically start translation
-                self.areas_tree.setCurrentItem(item)
-                # Use QTimer.singleShot to ensure UI is updated before starting translation
-                QTimer.singleShot(100, self.start_translation)
+                # Automatically start translation for the new area
+                # Post it so it runs after this handler has re-shown the window
+                QTimer.singleShot(0, partial(self.start_translation, area_id))
         except Exception as e:
             logger.error(f"Error adding area: {str(e)}", exc_info=True)
             show_error_message(self, "Error", f"Failed to add translation area:\n{str(e)}")
@@ -1079,32 +1294,26 @@ class MainWindow(QMainWindow):
         """Delete an area by its ID."""
         try:
             # First check if translation window exists and is running
-            window = self.translation_windows.get(area_id)
+            window = self.translation_windows.pop(area_id, None)
             if window is not None:
-                if window.isVisible():
-                    # Stop the translation process
-                    window.running = False
-                    window.timer.stop()
-                    
-                    # Wait a short moment to ensure cleanup
-                    QApplication.processEvents()
-                    
-                    # Close the window
-                    window.close()
-                    
-                    # Wait a short moment to ensure window is closed
-                    QApplication.processEvents()
+                # Stop the translation process
+                window.running = False
+                window.timer.stop()
                 
-                # Remove from translation windows dictionary
-                self.translation_windows.pop(area_id, None)
-            
-            # Find and remove from tree
-            for i in range(self.areas_tree.topLevelItemCount()):
-                item = self.areas_tree.topLevelItem(i)
-                if item.data(0, Qt.UserRole) == area_id:
-                    index = self.areas_tree.indexOfTopLevelItem(item)
-                    self.areas_tree.takeTopLevelItem(index)
-                    break
+                # close() runs the window's closeEvent synchronously, so no event pumping is needed.
+                # Stopped windows are only hidden, so close them too to release their hotkey.
+                window.close()
+                window.deleteLater()
+            
+            # Remove from tree
+            self._action_buttons.pop(area_id, None)
+            item = self._area_items.pop(area_id, None)
+            if item is not None:
+                self.areas_tree.setUpdatesEnabled(False)
+                try:
+                    self.areas_tree.takeTopLevelItem(self.areas_tree.indexOfTopLevelItem(item))
+                finally:
+                    self.areas_tree.setUpdatesEnabled(True)
             
             # Remove from config
             self.remove_area_from_config(area_id)
@@ -1142,23 +1351,23 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error removing area from config: {str(e)}", exc_info=True)
 
-    def start_translation(self):
-        """Start translation for a selected area."""
-        selected = self.areas_tree.selectedItems()
-        if not selected:
+    def start_translation(self, area_id: Optional[str] = None):
+        """Start translation for area_id, or for the selected area if none is given."""
+        if area_id is None:
+            selected = self.areas_tree.selectedItems()
+            item = selected[0] if selected else None
+        else:
+            item = self._area_items.get(area_id)
+        if item is None:
             QMessageBox.warning(self, "Warning", "Please select an area to translate")
             return
-        area_id = selected[0].data(0, Qt.UserRole)
+        area_id = item.data(0, Qt.UserRole)
         
-        # Parse position (X: x, Y: y)
-        position_text = selected[0].text(1)
-        x = int(position_text.split('X:')[1].split(',')[0].strip())
-        y = int(position_text.split('Y:')[1].strip())
+        # Translation windows read OCR settings from config
+        self._flush_pending_config()
+        self._start_ocr_warmup()
         
-        # Parse size (W: w, H: h)
-        size_text = selected[0].text(2)
-        w = int(size_text.split('W:')[1].split(',')[0].strip())
-        h = int(size_text.split('H:')[1].strip())
+        x, y, w, h = item.data(1, Qt.UserRole)
         
         try:
             logger.info(f"Starting translation for area {area_id} at ({x}, {y}) with size {w}x{h}")
@@ -1169,27 +1378,18 @@ class MainWindow(QMainWindow):
                     self.translation_windows[area_id].activateWindow()
                     return
                 else:
-                    del self.translation_windows[area_id]
-            
-            settings = {
-                'font_family': self.font_combo.currentText(),
-                'font_size': self.font_size_edit.text(),
-                'font_style': self.font_style_combo.currentText(),
-                'name_color': self.name_color_value,
-                'dialogue_color': self.dialogue_color_value,
-                'target_language': self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi'),
-                'source_language': self.language_name_to_code.get(self.source_lang_combo.currentText(), 'en'),
-                'background_color': self.bg_color_value,
-                'opacity': self.opacity_edit.text(),
-                'toggle_hotkey': self.hotkey_input.text() or 'Ctrl+1',
-                'auto_pause_enabled': self.auto_pause_checkbox.isChecked(),
-                'auto_pause_threshold': self.auto_pause_threshold_spinbox.value(),
-                'translation_mode': self.config_manager.get_translation_mode(),
-                'llm_studio_url': self.config_manager.get_llm_studio_url()
-            }
+                    # Release the stopped window and its hotkey before replacing it
+                    stale_window = self.translation_windows.pop(area_id)
+                    stale_window.close()
+                    stale_window.deleteLater()
+            
+            settings = self._window_settings(
+                translation_mode=self.config_manager.get_translation_mode(),
+                llm_studio_url=self.config_manager.get_llm_studio_url(),
+            )
             logger.info(f"Translation settings: {settings}")
             
-            logger.info(f"Creating TranslationWindow with text_processor: {hasattr(self, 'text_processor')}")
+            logger.info(f"Creating TranslationWindow with text_processor: {self.text_processor is not None}")
             translation_window = TranslationWindow(
                 self.add_area, 
                 settings, 
@@ -1229,11 +1429,11 @@ class MainWindow(QMainWindow):
             
             if area_id in self.translation_windows:
                 window = self.translation_windows[area_id]
-                if hasattr(window, 'running'):
-                    window.running = False
-                if hasattr(window, 'timer') and window.timer:
-                    window.timer.stop()
+                window.running = False
+                window.timer.stop()
                 del self.translation_windows[area_id]
+                # The window closes itself after this handler returns; free it afterwards
+                window.deleteLater()
                 logger.info(f"Removed translation window for area_id: {area_id}")
                 
                 # Update action button to show "Start"
@@ -1254,16 +1454,15 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         try:
-            # Check if there are active translation windows
-            active_windows = [window for window in self.translation_windows.values() 
-                            if window and window.isVisible()]
+            # Count open translation windows for the prompt; no list is needed
+            active_count = sum(1 for window in self.translation_windows.values() if window.isVisible())
             
-            if active_windows:
+            if active_count:
                 # Ask user if they want to close all translation windows
                 reply = QMessageBox.question(
                     self, 
                     "Close Application", 
-                    f"You have {len(active_windows)} active translation window(s).\nDo you want to close all translation windows and exit the application?",
+                    f"You have {active_count} active translation window(s).\nDo you want to close all translation windows and exit the application?",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.No
                 )
@@ -1272,15 +1471,15 @@ class MainWindow(QMainWindow):
                     event.ignore()
                     return
             
-            # Unregister add area hotkey
-            self.unregister_add_area_hotkey()
-            
-            # Unregister add area hotkey
-            self.unregister_add_area_hotkey()
+            # Save window position together with any queued text-field edits
+            self._pending_cfg['main_window_pos'] = f"{self.x()},{self.y()}"
+            self._flush_pending_config()
             
-            # Save window position
-            if self.config_manager:
-                self.config_manager.set_global_setting('main_window_pos', f"{self.x()},{self.y()}")
+            # Unregister add area hotkey; a failure here must not skip the cleanup below
+            try:
+                self.unregister_add_area_hotkey()
+            except Exception as e:
+                logger.error(f"Error unregistering add area hotkey: {str(e)}", exc_info=True)
             
             # Close all translation windows gracefully
             for area_id in list(self.translation_windows.keys()):  # Create a copy of keys to avoid modification during iteration
@@ -1288,27 +1487,29 @@ class MainWindow(QMainWindow):
                     window = self.translation_windows.get(area_id)
                     if window and window.isVisible():
                         # Stop the translation process first
-                        if hasattr(window, 'running'):
-                            window.running = False
-                        if hasattr(window, 'timer') and window.timer:
-                            window.timer.stop()
+                        window.running = False
+                        window.timer.stop()
                         
-                        # Close the window
+                        # Close the window; its closeEvent runs before close() returns
                         window.close()
-                        
-                        # Wait a moment for cleanup
-                        QApplication.processEvents()
                     
                     # Remove from dictionary
                     self.translation_windows.pop(area_id, None)
+                    if window:
+                        window.deleteLater()
                 except Exception as e:
                     logger.error(f"Error closing translation window {area_id}: {str(e)}")
                     # Continue with other windows even if one fails
                     continue
             
-            # Stop any remaining timers
-            if hasattr(self, 'timer') and self.timer:
-                self.timer.stop()
+            # Give a PaddleOCR load in progress time to finish; destroying a running QThread aborts the process
+            if self.ocr_warmup_thread is not None:
+                self.ocr_warmup_thread.wait(_THREAD_SHUTDOWN_WAIT_MS)
+            if self.version_check_thread is not None:
+                self.version_check_thread.wait(_THREAD_SHUTDOWN_WAIT_MS)
+            # Never start the translator preload once closing; finish one already importing
+            self._translator_warmup_timer.stop()
+            self.translator_warmup_thread.wait(_THREAD_SHUTDOWN_WAIT_MS)
             
             # Accept the close event
             event.accept()
@@ -1324,153 +1525,66 @@ class MainWindow(QMainWindow):
         pass
 
     def update_settings_state(self, enabled: bool):
-        """Enable or disable all settings controls."""
+        """Request that all settings controls be enabled or disabled."""
+        # Ensure enabled is a boolean
+        self._pending_settings_state = bool(enabled) if enabled is not None else True
+        if not self._settings_state_timer.isActive():
+            self._settings_state_timer.start()
+
+    def _apply_settings_state(self):
+        """Enable or disable all settings controls to match the last request."""
         try:
-            # Ensure enabled is a boolean
-            enabled = bool(enabled) if enabled is not None else True
+            enabled = self._pending_settings_state
+            # Start, stop and delete paths all re-request the state they are already in
+            if enabled == self._settings_enabled:
+                return
             
             # Add logging to debug the issue
-            logger.info(f"update_settings_state called with enabled={enabled}")
+            logger.info(f"Applying settings state enabled={enabled}")
             logger.info(f"Number of translation windows: {len(self.translation_windows)}")
             
-            # Font settings
-            if hasattr(self, 'font_combo'):
-                self.font_combo.setEnabled(enabled)
-            if hasattr(self, 'font_size_edit'):
-                self.font_size_edit.setEnabled(enabled)
-            if hasattr(self, 'font_style_combo'):
-                self.font_style_combo.setEnabled(enabled)
-            
-            # Color settings
-            if hasattr(self, 'name_color_button'):
-                self.name_color_button.setEnabled(enabled)
-            if hasattr(self, 'dialogue_color_button'):
-                self.dialogue_color_button.setEnabled(enabled)
-            
-            # Background settings
-            if hasattr(self, 'bg_color_button'):
-                self.bg_color_button.setEnabled(enabled)
-            if hasattr(self, 'opacity_edit'):
-                self.opacity_edit.setEnabled(enabled)
-            
-            # Language settings
-            if hasattr(self, 'source_lang_combo'):
-                self.source_lang_combo.setEnabled(enabled)
-            if hasattr(self, 'target_lang_combo'):
-                self.target_lang_combo.setEnabled(enabled)
-            
-            # Hotkey settings
-            if hasattr(self, 'hotkey_input'):
-                self.hotkey_input.setEnabled(enabled)
-            if hasattr(self, 'hotkey_apply_button'):
-                # Apply button should be disabled when settings are disabled OR when no changes are made
-                has_changes = hasattr(self, 'original_hotkey') and self.hotkey_input.text() != self.original_hotkey
-                self.hotkey_apply_button.setEnabled(enabled and has_changes)
-            if hasattr(self, 'add_area_hotkey_input'):
-                self.add_area_hotkey_input.setEnabled(enabled)
-            if hasattr(self, 'add_area_hotkey_apply_button'):
-                # Apply button should be disabled when settings are disabled OR when no changes are made
-                has_changes = hasattr(self, 'original_add_area_hotkey') and self.add_area_hotkey_input.text() != self.original_add_area_hotkey
-                self.add_area_hotkey_apply_button.setEnabled(enabled and has_changes)
-            
-            # Auto-pause settings
-            if hasattr(self, 'auto_pause_checkbox'):
-                self.auto_pause_checkbox.setEnabled(enabled)
-            if hasattr(self, 'auto_pause_threshold_spinbox'):
-                self.auto_pause_threshold_spinbox.setEnabled(enabled)
-            
-            # Credentials settings
-            if hasattr(self, 'credentials_edit'):
-                self.credentials_edit.setEnabled(enabled)
-            if hasattr(self, 'browse_button'):
-                self.browse_button.setEnabled(enabled)
-            
-            # Translation mode settings
-            if hasattr(self, 'mode_combo'):
-                self.mode_combo.setEnabled(enabled)
-            if hasattr(self, 'llm_studio_edit'):
-                self.llm_studio_edit.setEnabled(enabled)
-            if hasattr(self, 'llm_studio_model_edit'):
-                self.llm_studio_model_edit.setEnabled(enabled)
-            if hasattr(self, 'tesseract_path_edit'):
-                self.tesseract_path_edit.setEnabled(enabled)
-            if hasattr(self, 'tesseract_browse_button'):
-                self.tesseract_browse_button.setEnabled(enabled)
-            if hasattr(self, 'tesseract_test_button'):
-                self.tesseract_test_button.setEnabled(enabled)
-            if hasattr(self, 'ocr_mode_combo'):
-                self.ocr_mode_combo.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_edit'):
-                self.libretranslate_edit.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_test_button'):
-                self.libretranslate_test_button.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_ocr_mode_combo'):
-                self.libretranslate_ocr_mode_combo.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_tesseract_path_edit'):
-                self.libretranslate_tesseract_path_edit.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_tesseract_browse_button'):
-                self.libretranslate_tesseract_browse_button.setEnabled(enabled)
-            if hasattr(self, 'libretranslate_tesseract_test_button'):
-                self.libretranslate_tesseract_test_button.setEnabled(enabled)
-            
+            # Containers carry their children, including lazily built rows
+            for widget in self._toggleable_widgets:
+                widget.setEnabled(enabled)
+            for group in self._provider_groups.values():
+                group.setEnabled(enabled)
+
+            # Apply buttons also need an unapplied change to be enabled
+            self.hotkey_apply_button.setEnabled(
+                enabled and self.hotkey_input.text() != self.original_hotkey)
+            self.add_area_hotkey_apply_button.setEnabled(
+                enabled and self.add_area_hotkey_input.text() != self.original_add_area_hotkey)
+
             # Area management buttons - always enabled
-            if hasattr(self, 'add_button'):
-                self.add_button.setEnabled(True)
-            # Note: Start/Stop and Delete buttons are now in Action column for each area
-
-            # Update button styles - match the style from initial button styling
-            disabled_style = """
-                QPushButton {
-                    background-color: #cccccc;
-                    color: #666666;
-                    border: 1px solid #999999;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                    font-weight: 500;
-                    opacity: 0.7;
-                }
-                QPushButton:hover {
-                    background-color: #cccccc;
-                }
-            """
-            enabled_style = f"""
-                QPushButton {{
-                    background-color: {self.button_bg};
-                    color: {self.button_fg};
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.secondary_color};
-                }}
-                QPushButton:disabled {{
-                    background-color: #cccccc;
-                    color: #666666;
-                }}
-            """
-
-            # Apply styles to color, browse, and hotkey apply buttons - match Test Connection button style
-            for btn in [self.name_color_button, self.dialogue_color_button, 
-                       self.bg_color_button, self.browse_button, 
-                       self.hotkey_apply_button, self.add_area_hotkey_apply_button]:
-                if btn is not None:
-                    btn.setStyleSheet(disabled_style if not enabled else enabled_style)
+            # Note: Start/Stop and Delete buttons are in the Action column for each area
+            self.add_button.setEnabled(True)
+
+            # Disabled buttons pick up the :disabled rule of the window stylesheet
+            self._settings_enabled = enabled
         except Exception as e:
             logger.error(f"Error updating settings state: {e}")
+            self._settings_enabled = None
             # Set a default state if there's an error
-            widget_names = [
-                'font_combo', 'font_size_edit', 'font_style_combo',
-                'name_color_button', 'dialogue_color_button',
-                'bg_color_button', 'opacity_edit',
-                'source_lang_combo', 'target_lang_combo',
-                'credentials_edit', 'browse_button'
-            ]
-            for widget_name in widget_names:
-                if hasattr(self, widget_name):
-                    widget = getattr(self, widget_name)
-                    if widget is not None:
-                        widget.setEnabled(True)
+            for widget in getattr(self, '_toggleable_widgets', ()):
+                widget.setEnabled(True)
+
+    def _make_color_preview(self, color: str, color_name: str) -> QLabel:
+        """Create a framed 30x25 color swatch label."""
+        label = QLabel()
+        label.setProperty('color_name', color_name)
+        label.setFixedSize(30, 25)
+        label.setFrameStyle(QFrame.Box | QFrame.Plain)
+        label.setLineWidth(2)
+        self._set_color_preview(label, color)
+        return label
+
+    def _set_color_preview(self, label: QLabel, color: str):
+        """Fill a color preview swatch with a solid pixmap."""
+        pixmap = QPixmap(label.contentsRect().size())
+        pixmap.fill(QColor(color))
+        label.setPixmap(pixmap)
+        label.setProperty('color_hex', color)
+        label.setToolTip(f"Current {label.property('color_name')}: {color}")
 
     def pick_color(self, color_type: str):
         """Pick a color for name or dialogue."""
@@ -1481,11 +1595,11 @@ class MainWindow(QMainWindow):
                 hex_color = color.name()
                 if color_type == 'name_color':
                     self.name_color_value = hex_color
-                    self.name_color_preview.setStyleSheet(f"background-color: {hex_color}; border: 1px solid black;")
+                    self._set_color_preview(self.name_color_preview, hex_color)
                 else:
                     self.dialogue_color_value = hex_color
-                    self.dialogue_color_preview.setStyleSheet(f"background-color: {hex_color}; border: 1px solid black;")
-                self.config_manager.set_global_setting(color_type, hex_color)
+                    self._set_color_preview(self.dialogue_color_preview, hex_color)
+                # Saved together with the other text settings
                 self.update_translation_settings()
         except Exception as e:
             show_error_message(self, "Error", f"Failed to pick color: {str(e)}")
@@ -1496,9 +1610,10 @@ class MainWindow(QMainWindow):
             color = QColorDialog.getColor(QColor(self.bg_color_value), self, "Choose Background Color")
             if color.isValid():
                 self.bg_color_value = color.name()
-                self.bg_color_preview.setStyleSheet(f"background-color: {self.bg_color_value}; border: 1px solid black;")
+                self._set_color_preview(self.bg_color_preview, self.bg_color_value)
                 self.config_manager.set_background_color(self.bg_color_value)
-                self.update_translation_settings()
+                # The background needs no re-translation, only a window update
+                self._window_push_timer.start()
         except Exception as e:
             show_error_message(self, "Error", f"Failed to pick color: {str(e)}")
 
@@ -1511,16 +1626,20 @@ class MainWindow(QMainWindow):
                 languages = self.config_manager.get_all_languages()
             self.language_code_to_name = dict(zip(languages.keys(), languages.values()))
             self.language_name_to_code = dict(zip(languages.values(), languages.keys()))
-            self.source_lang_combo.addItems(languages.values())
-            self.target_lang_combo.addItems(languages.values())
-            current_source = self.config_manager.get_language_name(
-                self.config_manager.get_global_setting('source_language', 'en'))
-            current_target = self.config_manager.get_language_name(
-                self.config_manager.get_global_setting('target_language', 'vi'))
+            # Both combos list the same languages, so they share one model
+            self._language_model = QStringListModel(list(languages.values()), self)
+            self.source_lang_combo.setModel(self._language_model)
+            self.target_lang_combo.setModel(self._language_model)
+            # Resolve names from the languages dict already in hand
+            source_code = self.config_manager.get_source_language()
+            target_code = self.config_manager.get_target_language()
+            current_source = languages.get(source_code, source_code)
+            current_target = languages.get(target_code, target_code)
             self.source_lang_combo.setCurrentText(current_source)
             self.target_lang_combo.setCurrentText(current_target)
-            self.source_lang_combo.currentTextChanged.connect(self.update_translation_settings)
-            self.target_lang_combo.currentTextChanged.connect(self.update_translation_settings)
+            # Back-to-back language changes are applied in one pass
+            self.source_lang_combo.currentTextChanged.connect(self._mark_settings_dirty)
+            self.target_lang_combo.currentTextChanged.connect(self._mark_settings_dirty)
         except Exception as e:
             logger.error(f"Error loading languages: {str(e)}", exc_info=True)
             self.source_lang_combo.addItems(list(languages.values()))
@@ -1530,6 +1649,31 @@ class MainWindow(QMainWindow):
             self.config_manager.create_languages_section()
             self.config_manager.save_config()
 
+    def _mark_settings_dirty(self, *_):
+        """Flag pending font changes and (re)arm the single-shot flush timer."""
+        self._settings_dirty = True
+        self._settings_timer.start(50)
+
+    def _queue_config(self, key: str, value: str):
+        """Queue a global setting write and (re)arm the persist timer."""
+        self._pending_cfg[key] = value
+        self._persist_timer.start()
+
+    def _flush_pending_config(self):
+        """Write all queued global settings in one save."""
+        self._persist_timer.stop()
+        if not self._pending_cfg:
+            return
+        pending, self._pending_cfg = self._pending_cfg, {}
+        self.config_manager.set_global_settings(pending)
+
+    def _flush_translation_settings(self):
+        """Apply all font changes made since the last flush in one pass."""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        self.update_translation_settings()
+
     def update_translation_settings(self):
         """Update translation settings for all windows."""
         try:
@@ -1537,31 +1681,21 @@ class MainWindow(QMainWindow):
             target_lang = self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi')
             if source_lang == target_lang:
                 QMessageBox.warning(self, "Warning", "Source and target languages cannot be the same. Please select different languages.")
-                self.target_lang_combo.setCurrentText(self.config_manager.get_language_name(
-                    self.config_manager.get_global_setting('target_language', 'vi')))
+                saved_target = self.config_manager.get_target_language()
+                self.target_lang_combo.setCurrentText(self.language_code_to_name.get(saved_target, saved_target))
                 return
 
-            settings = {
-                'font_family': self.font_combo.currentText(),
-                'font_size': self.font_size_edit.text(),
-                'font_style': self.font_style_combo.currentText(),
-                'name_color': self.name_color_value,
-                'dialogue_color': self.dialogue_color_value,
-                'target_language': target_lang,
-                'source_language': source_lang,
-                'background_color': self.bg_color_value,
-                'opacity': self.opacity_edit.text(),
-                'toggle_hotkey': self.hotkey_input.text() or 'Ctrl+1',
-                'auto_pause_enabled': self.auto_pause_checkbox.isChecked(),
-                'auto_pause_threshold': self.auto_pause_threshold_spinbox.value()
-            }
-            self.config_manager.set_global_setting('font_family', settings['font_family'])
-            self.config_manager.set_global_setting('font_size', settings['font_size'])
-            self.config_manager.set_global_setting('font_style', settings['font_style'])
-            self.config_manager.set_global_setting('name_color', settings['name_color'])
-            self.config_manager.set_global_setting('dialogue_color', settings['dialogue_color'])
-            self.config_manager.set_source_language(settings['source_language'])
-            self.config_manager.set_target_language(settings['target_language'])
+            settings = self._window_settings(source_language=source_lang, target_language=target_lang)
+            text_settings = {key: settings[key] for key in ('font_family', 'font_size', 'font_style', 'name_color',
+                                                            'dialogue_color', 'source_language', 'target_language')}
+            # Reverted or re-emitted values need no save or re-translation
+            if text_settings == self._applied_text_settings:
+                return
+            self._applied_text_settings = text_settings
+            # One config save for all display and language settings
+            self.config_manager.set_global_settings(text_settings)
+            # The full settings below also cover any pending opacity or auto-pause push
+            self._window_push_timer.stop()
             for translation_window in self.translation_windows.values():
                 if translation_window.isVisible():
                     translation_window.apply_settings(settings)
@@ -1570,32 +1704,35 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error updating settings: {str(e)}", exc_info=True)
 
-    def update_opacity(self):
-        """Update window opacity."""
-        try:
-            opacity = float(self.opacity_edit.text())
-            if 0.01 <= opacity <= 1.0:
-                settings = {
-                    'font_family': self.font_combo.currentText(),
-                    'font_size': self.font_size_edit.text(),
-                    'font_style': self.font_style_combo.currentText(),
-                    'name_color': self.name_color_value,
-                    'dialogue_color': self.dialogue_color_value,
-                    'target_language': self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi'),
-                    'source_language': self.language_name_to_code.get(self.source_lang_combo.currentText(), 'en'),
-                    'background_color': self.bg_color_value,
-                    'opacity': str(opacity),
-                    'toggle_hotkey': self.hotkey_input.text() or 'Ctrl+1',
-                    'auto_pause_enabled': self.auto_pause_checkbox.isChecked(),
-                    'auto_pause_threshold': self.auto_pause_threshold_spinbox.value()
-                }
-                for window in self.translation_windows.values():
-                    if window.isVisible():
-                        window.apply_settings(settings)
-            else:
-                self.opacity_edit.setText('0.85')
-        except ValueError:
-            self.opacity_edit.setText('0.85')
+    def _window_settings(self, **overrides) -> Dict:
+        """Collect the display settings passed to translation windows, with overrides applied."""
+        settings = {
+            'font_family': self.font_combo.currentText(),
+            'font_size': self.font_size_edit.text(),
+            'font_style': self.font_style_combo.currentText(),
+            'name_color': self.name_color_value,
+            'dialogue_color': self.dialogue_color_value,
+            'target_language': self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi'),
+            'source_language': self.language_name_to_code.get(self.source_lang_combo.currentText(), 'en'),
+            'background_color': self.bg_color_value,
+            'opacity': str(self.opacity_spin.value()),
+            'toggle_hotkey': self.hotkey_input.text() or 'Ctrl+1',
+            'auto_pause_enabled': self.auto_pause_checkbox.isChecked(),
+            'auto_pause_threshold': self.auto_pause_threshold_spinbox.value(),
+        }
+        settings.update(overrides)
+        return settings
+
+    def update_opacity(self, opacity: float):
+        """Update window opacity once the spinbox settles."""
+        self._window_push_timer.start()
+
+    def _push_window_settings(self):
+        """Apply the current display settings to all visible translation windows."""
+        settings = self._window_settings()
+        for window in self.translation_windows.values():
+            if window.isVisible():
+                window.apply_settings(settings)
 
     def browse_credentials(self):
         """Browse for Google Cloud credentials file."""
@@ -1612,20 +1749,44 @@ class MainWindow(QMainWindow):
         if file_name:
             self.credentials_edit.setText(file_name)
             self.config_manager.set_credentials_path(file_name)
-            if QMessageBox.question(self, "Restart Required",
-                                   "Restart now to apply new credentials?") == QMessageBox.Yes:
+            if self._reload_google_clients(file_name):
+                QMessageBox.information(self, "Credentials Updated",
+                                        "The new Google Cloud credentials are now in use.")
+            elif QMessageBox.question(self, "Restart Required",
+                                      "Restart now to apply new credentials?") == QMessageBox.Yes:
                 QApplication.quit()
                 os.execv(sys.executable, ['python'] + sys.argv)
 
+    def _reload_google_clients(self, credentials_path: str) -> bool:
+        """Switch the Google Cloud clients to new credentials; False if a restart is needed instead."""
+        # Without a text processor (started without valid credentials) nothing can be swapped
+        if self.text_processor is None or not validate_credentials(credentials_path):
+            return False
+        try:
+            from google.cloud import translate_v2 as translate
+            from google.cloud import vision
+
+            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+            self.text_processor.set_google_clients(translate.Client(), vision.ImageAnnotatorClient())
+            logger.info("Google Cloud clients reloaded with new credentials")
+            return True
+        except Exception as e:
+            logger.error(f"Error reloading Google Cloud clients: {str(e)}", exc_info=True)
+            return False
+
     def on_hotkey_changed(self):
-        """Handle hotkey input changes."""
+        """Handle hotkey input changes; rapid key combos are checked once."""
+        if not self._hotkey_timer.isActive():
+            self._hotkey_timer.start(50)
+
+    def _refresh_hotkey_apply_button(self):
+        """Enable the toggle hotkey Apply button if the hotkey changed."""
         try:
             current_hotkey = self.hotkey_input.text()
             # Enable apply button only if hotkey has changed and is not empty
-            if hasattr(self, 'hotkey_apply_button'):
-                self.hotkey_apply_button.setEnabled(
-                    bool(current_hotkey) and current_hotkey != self.original_hotkey
-                )
+            self.hotkey_apply_button.setEnabled(
+                bool(current_hotkey) and current_hotkey != self.original_hotkey
+            )
         except Exception as e:
             logger.error(f"Error handling hotkey change: {str(e)}", exc_info=True)
     
@@ -1649,20 +1810,9 @@ class MainWindow(QMainWindow):
             self.hotkey_apply_button.setEnabled(False)
             
             # Update all active translation windows
+            settings = self._window_settings(toggle_hotkey=hotkey)
             for translation_window in self.translation_windows.values():
                 if translation_window.isVisible():
-                    settings = {
-                        'font_family': self.font_combo.currentText(),
-                        'font_size': self.font_size_edit.text(),
-                        'font_style': self.font_style_combo.currentText(),
-                        'name_color': self.name_color_value,
-                        'dialogue_color': self.dialogue_color_value,
-                        'target_language': self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi'),
-                        'source_language': self.language_name_to_code.get(self.source_lang_combo.currentText(), 'en'),
-                        'background_color': self.bg_color_value,
-                        'opacity': self.opacity_edit.text(),
-                        'toggle_hotkey': hotkey
-                    }
                     translation_window.apply_settings(settings)
             
             QMessageBox.information(self, "Hotkey Updated", 
@@ -1677,15 +1827,8 @@ class MainWindow(QMainWindow):
         if not hotkey or '+' not in hotkey:
             return False
         
-        parts = hotkey.split('+')
-        if len(parts) < 2:
-            return False
-        
-        # Check if at least one modifier is present
-        modifiers = {'Ctrl', 'Shift', 'Alt'}
-        has_modifier = any(mod in parts for mod in modifiers)
-        
-        return has_modifier
+        # Check if at least one modifier is present ('+' guarantees two parts)
+        return not _HOTKEY_MODIFIERS.isdisjoint(hotkey.split('+'))
     
     def parse_hotkey(self, hotkey: str):
         """Parse hotkey string and return (modifier, virtual_key) tuple."""
@@ -1708,11 +1851,10 @@ class MainWindow(QMainWindow):
             elif part_upper == 'ALT':
                 modifier |= MOD_ALT
             else:
-                # This should be the key
-                if part_upper in VK_CODES:
-                    key = VK_CODES[part_upper]
-                elif part in VK_CODES:
-                    key = VK_CODES[part]
+                # This should be the key; VK_CODES keys are upper-case, symbols are unaffected
+                vk = VK_CODES.get(part_upper)
+                if vk is not None:
+                    key = vk
                 else:
                     logger.warning(f"Unknown key in hotkey: {part}")
         
@@ -1738,10 +1880,6 @@ class MainWindow(QMainWindow):
             logger.warning("No QCoreApplication instance; cannot register global hotkey")
             return
         
-        if self.add_area_hotkey_filter is None:
-            self.add_area_hotkey_filter = WindowsHotkeyFilterMain(self.on_add_area_hotkey_triggered)
-            app.installNativeEventFilter(self.add_area_hotkey_filter)
-        
         # Use a unique ID for the add area hotkey
         self.add_area_hotkey_id = HOTKEY_ID_BASE_MAIN + 1
         user32 = ctypes.windll.user32
@@ -1756,8 +1894,7 @@ class MainWindow(QMainWindow):
             self.add_area_hotkey_id = None
             return
         
-        if self.add_area_hotkey_filter:
-            self.add_area_hotkey_filter.set_hotkey_id(self.add_area_hotkey_id)
+        HOTKEY_DISPATCHER.register(self.add_area_hotkey_id, self.on_add_area_hotkey_triggered)
         
         logger.info(f"Add area hotkey {hotkey} registered")
     
@@ -1769,13 +1906,8 @@ class MainWindow(QMainWindow):
         if self.add_area_hotkey_id is not None:
             user32 = ctypes.windll.user32
             user32.UnregisterHotKey(None, self.add_area_hotkey_id)
+            HOTKEY_DISPATCHER.unregister(self.add_area_hotkey_id)
             self.add_area_hotkey_id = None
-        
-        if self.add_area_hotkey_filter is not None:
-            app = QCoreApplication.instance()
-            if app:
-                app.removeNativeEventFilter(self.add_area_hotkey_filter)
-            self.add_area_hotkey_filter = None
             logger.info("Add area hotkey listener removed")
     
     def on_add_area_hotkey_triggered(self):
@@ -1785,14 +1917,18 @@ class MainWindow(QMainWindow):
         self.add_area()
     
     def on_add_area_hotkey_changed(self):
-        """Handle add area hotkey input changes."""
+        """Handle add area hotkey input changes; rapid key combos are checked once."""
+        if not self._add_area_hotkey_timer.isActive():
+            self._add_area_hotkey_timer.start(50)
+
+    def _refresh_add_area_hotkey_apply_button(self):
+        """Enable the add area hotkey Apply button if the hotkey changed."""
         try:
             current_hotkey = self.add_area_hotkey_input.text()
             # Enable apply button only if hotkey has changed and is not empty
-            if hasattr(self, 'add_area_hotkey_apply_button'):
-                self.add_area_hotkey_apply_button.setEnabled(
-                    bool(current_hotkey) and current_hotkey != self.original_add_area_hotkey
-                )
+            self.add_area_hotkey_apply_button.setEnabled(
+                bool(current_hotkey) and current_hotkey != self.original_add_area_hotkey
+            )
         except Exception as e:
             logger.error(f"Error handling add area hotkey change: {str(e)}", exc_info=True)
     
@@ -1836,198 +1972,130 @@ class MainWindow(QMainWindow):
             enabled = self.auto_pause_checkbox.isChecked()
             threshold = self.auto_pause_threshold_spinbox.value()
             
-            # Save to config
-            self.config_manager.set_auto_pause_enabled(enabled)
-            self.config_manager.set_auto_pause_threshold(threshold)
+            # Save to config once the spinbox settles
+            self._queue_config('auto_pause_enabled', str(enabled))
+            self._queue_config('auto_pause_threshold', str(threshold))
             
-            # Update all active translation windows
-            for translation_window in self.translation_windows.values():
-                if translation_window.isVisible():
-                    settings = {
-                        'font_family': self.font_combo.currentText(),
-                        'font_size': self.font_size_edit.text(),
-                        'font_style': self.font_style_combo.currentText(),
-                        'name_color': self.name_color_value,
-                        'dialogue_color': self.dialogue_color_value,
-                        'target_language': self.language_name_to_code.get(self.target_lang_combo.currentText(), 'vi'),
-                        'source_language': self.language_name_to_code.get(self.source_lang_combo.currentText(), 'en'),
-                        'background_color': self.bg_color_value,
-                        'opacity': self.opacity_edit.text(),
-                        'toggle_hotkey': self.hotkey_input.text() or 'Ctrl+1',
-                        'auto_pause_enabled': enabled,
-                        'auto_pause_threshold': threshold
-                    }
-                    translation_window.apply_settings(settings)
+            # Update all active translation windows once the spinbox settles
+            self._window_push_timer.start()
             
             logger.info(f"Auto-pause settings updated: enabled={enabled}, threshold={threshold}")
         except Exception as e:
             logger.error(f"Error updating auto-pause settings: {str(e)}", exc_info=True)
 
+    @cached_property
+    def version_checker(self) -> VersionChecker:
+        """Version checker, constructed on first update check."""
+        return VersionChecker()
+    
+    def _schedule_version_check(self, delay_ms: int = 3600000):
+        """Schedule the next update check (every hour by default)."""
+        QTimer.singleShot(delay_ms, self._do_version_check)
+    
+    def _do_version_check(self):
+        """Run an update check and reschedule the next one."""
+        self.check_for_updates()
+        self._schedule_version_check()
+    
     def check_for_updates(self):
         """Check for application updates."""
         try:
-            # Get the last update check time from config
-            last_check = self.config_manager.get_global_setting('last_update_check', '0')
             current_time = int(time.time())
             
-            # Ensure last_check is a valid integer
-            try:
-                last_check_time = int(last_check)
-            except (ValueError, TypeError):
-                # If invalid, reset to 0 and save
-                last_check_time = 0
-                self.config_manager.set_global_setting('last_update_check', '0')
-            
             # Only check if it's been at least 6 hours since the last check
-            if current_time - last_check_time >= 21600:  # 6 hours in seconds
-                self.version_checker.check_for_updates(self)
+            if current_time - self._last_update_check >= 21600:  # 6 hours in seconds
+                if self.version_check_thread is None:
+                    self.version_check_thread = VersionCheckThread(self.version_checker)
+                    self.version_check_thread.update_available.connect(self.on_update_available)
+                    self.version_check_thread.finished.connect(self.on_version_check_finished)
+                    self.version_check_thread.start()
                 # Update the last check time
+                self._last_update_check = current_time
                 self.config_manager.set_global_setting('last_update_check', str(current_time))
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
             # Reset the last check time on error
+            self._last_update_check = 0
             try:
                 self.config_manager.set_global_setting('last_update_check', '0')
             except:
                 pass
     
-    def on_translation_mode_changed(self):
+    def on_update_available(self, latest_version: str, download_url: str):
+        """Show the update notification on the UI thread."""
+        self.version_checker.show_update_notification(self, latest_version, download_url)
+    
+    def on_version_check_finished(self):
+        """Handle update check thread completion."""
+        self.version_check_thread = None
+    
+    def on_translation_mode_changed(self, index: Optional[int] = None):
         """Handle translation mode change."""
         try:
-            mode_index = self.mode_combo.currentIndex()
-            if mode_index == 0:
-                mode = 'google'
-            elif mode_index == 1:
-                mode = 'local'
-            else:  # mode_index == 2
-                mode = 'libretranslate'
-            self.config_manager.set_translation_mode(mode)
-            self.update_translation_mode_ui()
+            # Called without an index during initialization; the mode is already saved then
+            if index is None:
+                mode = _MODES[self.mode_combo.currentIndex()]
+            else:
+                mode = _MODES[index]
+                self.config_manager.set_translation_mode(mode)
+            self._show_provider(mode)
             logger.info(f"Translation mode changed to: {mode}")
         except Exception as e:
             logger.error(f"Error changing translation mode: {str(e)}", exc_info=True)
     
-    def update_translation_mode_ui(self):
-        """Update UI based on selected translation mode."""
+    def _show_provider(self, mode: str):
+        """Show the settings for mode and hide the other providers'."""
         try:
-            mode = self.config_manager.get_translation_mode()
-            is_local_mode = (mode == 'local')
-            is_libretranslate_mode = (mode == 'libretranslate')
-            
-            # Show/hide LLM Studio settings (if it exists)
-            if hasattr(self, 'llm_studio_group'):
-                self.llm_studio_group.setVisible(is_local_mode)
-            
-            # Show/hide LibreTranslate settings (if it exists)
-            if hasattr(self, 'libretranslate_group'):
-                self.libretranslate_group.setVisible(is_libretranslate_mode)
-            
-            # Show/hide Google Cloud credentials (if it exists)
-            if hasattr(self, 'credentials_group'):
-                self.credentials_group.setVisible(not is_local_mode and not is_libretranslate_mode)
-            
-            # Update Tesseract path field visibility based on OCR mode
-            if is_local_mode or is_libretranslate_mode:
-                ocr_mode = self.config_manager.get_ocr_mode()
-                is_tesseract_mode = (ocr_mode == 'tesseract')
-                if hasattr(self, 'tesseract_path_layout'):
-                    for i in range(self.tesseract_path_layout.count()):
-                        widget = self.tesseract_path_layout.itemAt(i).widget()
-                        if widget:
-                            widget.setVisible(is_tesseract_mode)
-                if hasattr(self, 'libretranslate_tesseract_path_layout'):
-                    for i in range(self.libretranslate_tesseract_path_layout.count()):
-                        widget = self.libretranslate_tesseract_path_layout.itemAt(i).widget()
-                        if widget:
-                            widget.setVisible(is_tesseract_mode)
+            active_group = self._ensure_provider_group(mode)
+            # The stack sizes itself to its largest page unless the others are ignored
+            for group in self._provider_groups.values():
+                policy = QSizePolicy.Preferred if group is active_group else QSizePolicy.Ignored
+                group.setSizePolicy(policy, policy)
+            if active_group is not None:
+                self._provider_stack.setCurrentIndex(self._provider_page_index[mode])
+            self._provider_stack.setVisible(active_group is not None)
+            
+            # Google Cloud is the only mode that uses the credentials file
+            self.credentials_group.setVisible(mode == 'google')
+            
+            # Move the shared OCR panel into the active provider group
+            if active_group is not None:
+                if self.ocr_tess_panel.parentWidget() is not active_group:
+                    active_group.layout().addWidget(self.ocr_tess_panel)
+                    self.ocr_tess_panel.setVisible(True)
+                self.ocr_tess_panel.set_tesseract_path_visible(self.ocr_mode_combo.currentIndex() == _OCR_INDEX['tesseract'])
         except Exception as e:
             logger.error(f"Error updating translation mode UI: {str(e)}", exc_info=True)
     
-    def on_llm_studio_url_changed(self):
-        """Handle LLM Studio URL change."""
-        try:
-            url = self.llm_studio_edit.text()
-            if url:
-                self.config_manager.set_llm_studio_url(url)
-                logger.info(f"LLM Studio URL changed to: {url}")
-        except Exception as e:
-            logger.error(f"Error changing LLM Studio URL: {str(e)}", exc_info=True)
-    
-    def on_llm_studio_model_changed(self):
-        """Handle LLM Studio model name change."""
+    def _on_provider_field_changed(self, key: str, allow_empty: bool, text: str):
+        """Queue a provider setting edited in one of the provider groups."""
         try:
-            model = self.llm_studio_model_edit.text()
-            self.config_manager.set_llm_studio_model(model)
-            logger.info(f"LLM Studio model changed to: {model if model else 'auto-detect'}")
+            if text or allow_empty:
+                self._queue_config(key, text)
+                logger.info(f"{key} changed to: {text if text else '(empty)'}")
         except Exception as e:
-            logger.error(f"Error changing LLM Studio model: {str(e)}", exc_info=True)
+            logger.error(f"Error changing {key}: {str(e)}", exc_info=True)
     
     def on_ocr_mode_changed(self):
         """Handle OCR mode change."""
         try:
-            # Get the sender widget to determine which combo changed
-            sender = self.sender()
-            mode_index = None
-            
-            if hasattr(self, 'ocr_mode_combo') and sender == self.ocr_mode_combo:
-                mode_index = self.ocr_mode_combo.currentIndex()
-            elif hasattr(self, 'libretranslate_ocr_mode_combo') and sender == self.libretranslate_ocr_mode_combo:
-                mode_index = self.libretranslate_ocr_mode_combo.currentIndex()
-            else:
-                # Fallback to current config value (used during initialization)
-                current_mode = self.config_manager.get_ocr_mode()
-                mode_index = 0 if current_mode == 'tesseract' else 1
-            
-            mode = 'tesseract' if mode_index == 0 else 'paddleocr'
+            mode = _OCR_MODES[self.ocr_mode_combo.currentIndex()]
             
             # Only update config if sender is not None (i.e., user changed it)
-            if sender is not None:
+            if self.sender() is not None:
                 self.config_manager.set_ocr_mode(mode)
             
-            # Sync both OCR mode combos if they exist
-            if hasattr(self, 'ocr_mode_combo') and sender != self.ocr_mode_combo:
-                self.ocr_mode_combo.blockSignals(True)
-                self.ocr_mode_combo.setCurrentIndex(mode_index)
-                self.ocr_mode_combo.blockSignals(False)
-            if hasattr(self, 'libretranslate_ocr_mode_combo') and sender != self.libretranslate_ocr_mode_combo:
-                self.libretranslate_ocr_mode_combo.blockSignals(True)
-                self.libretranslate_ocr_mode_combo.setCurrentIndex(mode_index)
-                self.libretranslate_ocr_mode_combo.blockSignals(False)
-            
             # Update Tesseract path field visibility based on OCR mode
-            is_tesseract_mode = (mode == 'tesseract')
-            if hasattr(self, 'tesseract_path_layout'):
-                for i in range(self.tesseract_path_layout.count()):
-                    widget = self.tesseract_path_layout.itemAt(i).widget()
-                    if widget:
-                        widget.setVisible(is_tesseract_mode)
-            if hasattr(self, 'libretranslate_tesseract_path_layout'):
-                for i in range(self.libretranslate_tesseract_path_layout.count()):
-                    widget = self.libretranslate_tesseract_path_layout.itemAt(i).widget()
-                    if widget:
-                        widget.setVisible(is_tesseract_mode)
+            self.ocr_tess_panel.set_tesseract_path_visible(mode == 'tesseract')
             
             logger.info(f"OCR mode changed to: {mode}")
         except Exception as e:
             logger.error(f"Error changing OCR mode: {str(e)}", exc_info=True)
     
-    def on_tesseract_path_changed(self):
+    def on_tesseract_path_changed(self, text: str):
         """Handle Tesseract path change."""
         try:
-            # Get the sender widget to determine which field changed
-            sender = self.sender()
-            if sender == self.tesseract_path_edit:
-                path = self.tesseract_path_edit.text().strip()
-            elif hasattr(self, 'libretranslate_tesseract_path_edit') and sender == self.libretranslate_tesseract_path_edit:
-                path = self.libretranslate_tesseract_path_edit.text().strip()
-            else:
-                # Fallback: try to get from whichever is visible
-                if hasattr(self, 'tesseract_path_edit') and self.tesseract_path_edit.isVisible():
-                    path = self.tesseract_path_edit.text().strip()
-                elif hasattr(self, 'libretranslate_tesseract_path_edit') and self.libretranslate_tesseract_path_edit.isVisible():
-                    path = self.libretranslate_tesseract_path_edit.text().strip()
-                else:
-                    path = self.config_manager.get_tesseract_path()
+            path = text.strip()
             
             if path:
                 # Validate path if provided
@@ -2038,17 +2106,7 @@ class MainWindow(QMainWindow):
                 elif os.name == 'nt' and not path.lower().endswith('.exe'):
                     logger.warning(f"Tesseract path should point to .exe file: {path}")
             
-            self.config_manager.set_tesseract_path(path)
-            
-            # Sync both fields if they exist (to keep them in sync)
-            if hasattr(self, 'tesseract_path_edit') and sender != self.tesseract_path_edit:
-                self.tesseract_path_edit.blockSignals(True)
-                self.tesseract_path_edit.setText(path)
-                self.tesseract_path_edit.blockSignals(False)
-            if hasattr(self, 'libretranslate_tesseract_path_edit') and sender != self.libretranslate_tesseract_path_edit:
-                self.libretranslate_tesseract_path_edit.blockSignals(True)
-                self.libretranslate_tesseract_path_edit.setText(path)
-                self.libretranslate_tesseract_path_edit.blockSignals(False)
+            self._queue_config('tesseract_path', path)
             
             logger.info(f"Tesseract path changed to: {path if path else 'system PATH'}")
         except Exception as e:
@@ -2130,15 +2188,10 @@ class MainWindow(QMainWindow):
                 if reply == QMessageBox.No:
                     return
             
-            # Update both Tesseract path fields if they exist
-            if hasattr(self, 'tesseract_path_edit'):
-                self.tesseract_path_edit.blockSignals(True)
-                self.tesseract_path_edit.setText(file_name)
-                self.tesseract_path_edit.blockSignals(False)
-            if hasattr(self, 'libretranslate_tesseract_path_edit'):
-                self.libretranslate_tesseract_path_edit.blockSignals(True)
-                self.libretranslate_tesseract_path_edit.setText(file_name)
-                self.libretranslate_tesseract_path_edit.blockSignals(False)
+            # Update the Tesseract path field without re-triggering validation
+            path_edit = self.ocr_tess_panel.tesseract_path_edit
+            with QSignalBlocker(path_edit):
+                path_edit.setText(file_name)
             
             self.config_manager.set_tesseract_path(file_name)
             logger.info(f"Tesseract path configured: {file_name}")
@@ -2155,6 +2208,7 @@ class MainWindow(QMainWindow):
     def test_tesseract(self):
         """Test if Tesseract is working correctly."""
         try:
+            self._flush_pending_config()
             from src.text_processing import TextProcessor
             import numpy as np
             from PIL import Image
@@ -2280,21 +2334,10 @@ class MainWindow(QMainWindow):
                 f"An error occurred while testing Tesseract:\n{str(e)}"
             )
     
-    def on_libretranslate_url_changed(self):
-        """Handle LibreTranslate URL change."""
-        try:
-            url = self.libretranslate_edit.text()
-            if url:
-                self.config_manager.set_libretranslate_url(url)
-                logger.info(f"LibreTranslate URL changed to: {url}")
-        except Exception as e:
-            logger.error(f"Error changing LibreTranslate URL: {str(e)}", exc_info=True)
-    
     def test_libretranslate(self):
         """Test if LibreTranslate API is accessible."""
         try:
-            from src.translator.libretranslate_translator import LibreTranslateTranslator
-            from PyQt5.QtWidgets import QMessageBox
+            LibreTranslateTranslator = _get_translator_cls('libretranslate')
             
             url = self.libretranslate_edit.text() or self.config_manager.get_libretranslate_url()
             if not url:
@@ -11,16 +11,15 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QShortcut
 )
-from PyQt5.QtCore import Qt, QTimer, QPoint, QCoreApplication, QAbstractNativeEventFilter, QEvent
+from PyQt5.QtCore import Qt, QTimer, QPoint, QCoreApplication, QEvent
 from PyQt5.QtGui import QFont, QColor, QKeySequence
 from src.config_manager import ConfigManager
 from src.text_processing import TextProcessor
+from src.ui.hotkeys import HOTKEY_DISPATCHER
 from typing import Tuple, Optional, Callable, Dict, List
 import os
 import ctypes
-from ctypes import wintypes
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 import time
 import threading
@@ -30,7 +29,6 @@ import cv2
 logger = logging.getLogger(__name__)
 
 IS_WINDOWS = os.name == 'nt'
-WM_HOTKEY = 0x0312
 MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 MOD_ALT = 0x0001
@@ -59,31 +57,20 @@ VK_CODES = {
     '\\': 0xDC, ';': 0xBA, "'": 0xDE, ',': 0xBC, '.': 0xBE, '/': 0xBF,
 }
 
-if IS_WINDOWS:
-
-    class WindowsHotkeyFilter(QAbstractNativeEventFilter):
-        """Event filter to capture native WM_HOTKEY events."""
-
-        def __init__(self, callback: Callable):
-            super().__init__()
-            self.callback = callback
-            self.hotkey_id: Optional[int] = None
-
-        def set_hotkey_id(self, hotkey_id: Optional[int]):
-            self.hotkey_id = hotkey_id
-
-        def nativeEventFilter(self, event_type, message):
-            if self.hotkey_id is None:
-                return False, 0
-            if event_type == "windows_generic_MSG":
-                try:
-                    msg = ctypes.cast(int(message), ctypes.POINTER(wintypes.MSG)).contents
-                except (ValueError, TypeError):
-                    return False, 0
-                if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
-                    QTimer.singleShot(0, self.callback)
-                    return True, 0
-            return False, 0
+# Round overlay buttons, built once so repeated restyles reuse the same strings
+_ROUND_BUTTON_STYLE = (
+    "QPushButton { background-color: rgba(255,255,255,40); color: %s; border: 1px solid %s; border-radius: 12px; }"
+    "QPushButton:hover { background-color: rgba(255,255,255,100); color: #ffffff; }"
+)
+_CAPTURE_IDLE_STYLE = _ROUND_BUTTON_STYLE % ('#00ff00', '#00ff00')
+_CAPTURE_RUNNING_STYLE = _ROUND_BUTTON_STYLE % ('#ff0000', '#ff0000')
+_CLOSE_BUTTON_STYLE = _CAPTURE_RUNNING_STYLE
+_TOGGLE_UI_BUTTON_STYLE = _ROUND_BUTTON_STYLE % ('#ffff00', '#ffff00')
+_AUTO_PAUSED_STYLE = (
+    "QPushButton { background-color: rgba(100,100,100,200); color: white; border: 1px solid #666666; border-radius: 12px; font-size: 10pt; }"
+    "QPushButton:hover { background-color: rgba(100,100,100,255); }"
+)
+_COUNTER_LABEL_STYLE = "color: rgba(255, 255, 255, 150); background-color: transparent; font-size: 10px; padding: 2px;"
 
 
 class TranslationCache:
@@ -200,7 +187,6 @@ class TranslationWindow(QMainWindow):
         self.text_processor = text_processor
         self.settings = settings
         self.global_hotkey_id: Optional[int] = None
-        self.global_hotkey_filter: Optional['WindowsHotkeyFilter'] = None
         
         # Initialize translation cache and rate limiter
         self.translation_cache = TranslationCache(max_size=None, expiration_minutes=10/60)  # Unlimited cache with 10s expiration
@@ -259,18 +245,14 @@ class TranslationWindow(QMainWindow):
 
         # Vision API counter
         self.vision_counter_label = QLabel("Vision API: 0 requests")
-        self.vision_counter_label.setStyleSheet(
-            "color: rgba(255, 255, 255, 150); background-color: transparent; font-size: 10px; padding: 2px;"
-        )
+        self.vision_counter_label.setStyleSheet(_COUNTER_LABEL_STYLE)
         self.vision_counter_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.vision_counter_label.setFixedWidth(120)  # Set fixed width for Vision API label
         self.api_labels_layout.addWidget(self.vision_counter_label)
 
         # Translation API counter
         self.translation_counter_label = QLabel("Translation API: 0 requests")
-        self.translation_counter_label.setStyleSheet(
-            "color: rgba(255, 255, 255, 150); background-color: transparent; font-size: 10px; padding: 2px;"
-        )
+        self.translation_counter_label.setStyleSheet(_COUNTER_LABEL_STYLE)
         self.translation_counter_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.translation_counter_label.setFixedWidth(150)  # Set fixed width for Translation API label
         self.api_labels_layout.addWidget(self.translation_counter_label)
@@ -285,30 +267,21 @@ class TranslationWindow(QMainWindow):
         # Capture button (fixed in top-left)
         self.capture_button = QPushButton("▶", self)
         self.capture_button.setFixedSize(24, 24)
-        self.capture_button.setStyleSheet(
-            f"QPushButton {{ background-color: rgba(255,255,255,40); color: #00ff00; border: 1px solid #00ff00; border-radius: 12px; }}"
-            f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-        )
+        self.capture_button.setStyleSheet(_CAPTURE_IDLE_STYLE)
         self.capture_button.clicked.connect(self.toggle_capture)
         self.capture_button.raise_()
 
         # Close button (fixed in top-right)
         self.close_button = QPushButton("✕", self)
         self.close_button.setFixedSize(24, 24)
-        self.close_button.setStyleSheet(
-            f"QPushButton {{ background-color: rgba(255,255,255,40); color: #ff0000; border: 1px solid #ff0000; border-radius: 12px; }}"
-            f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-        )
+        self.close_button.setStyleSheet(_CLOSE_BUTTON_STYLE)
         self.close_button.clicked.connect(self.close_program)
         self.close_button.raise_()
 
         # Toggle UI visibility button (fixed near close button)
         self.toggle_ui_button = QPushButton("👁", self)
         self.toggle_ui_button.setFixedSize(24, 24)
-        self.toggle_ui_button.setStyleSheet(
-            f"QPushButton {{ background-color: rgba(255,255,255,40); color: #ffff00; border: 1px solid #ffff00; border-radius: 12px; }}"
-            f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-        )
+        self.toggle_ui_button.setStyleSheet(_TOGGLE_UI_BUTTON_STYLE)
         self.toggle_ui_button.clicked.connect(self.toggle_ui_visibility)
         self.toggle_ui_button.raise_()
 
@@ -434,12 +407,10 @@ class TranslationWindow(QMainWindow):
             elif part_upper == 'ALT':
                 modifier |= MOD_ALT
             else:
-                # This should be the key
-                # Try to find it in VK_CODES (check uppercase for letters)
-                if part_upper in VK_CODES:
-                    key = VK_CODES[part_upper]
-                elif part in VK_CODES:  # For symbols that might be case-sensitive
-                    key = VK_CODES[part]
+                # This should be the key; VK_CODES keys are upper-case, symbols are unaffected
+                vk = VK_CODES.get(part_upper)
+                if vk is not None:
+                    key = vk
                 else:
                     logger.warning(f"Unknown key in hotkey: {part}")
         
@@ -462,9 +433,6 @@ class TranslationWindow(QMainWindow):
         if app is None:
             logger.warning("No QCoreApplication instance; cannot register global hotkey")
             return
-        if self.global_hotkey_filter is None:
-            self.global_hotkey_filter = WindowsHotkeyFilter(self.on_global_hotkey_triggered)
-            app.installNativeEventFilter(self.global_hotkey_filter)
         TranslationWindow._global_hotkey_counter += 1
         self.global_hotkey_id = HOTKEY_ID_BASE + TranslationWindow._global_hotkey_counter
         user32 = ctypes.windll.user32
@@ -478,8 +446,7 @@ class TranslationWindow(QMainWindow):
             logger.error(f"Failed to register global hotkey {hotkey} (error {error_code})")
             self.global_hotkey_id = None
             return
-        if self.global_hotkey_filter:
-            self.global_hotkey_filter.set_hotkey_id(self.global_hotkey_id)
+        HOTKEY_DISPATCHER.register(self.global_hotkey_id, self.on_global_hotkey_triggered)
         logger.info(f"Global hotkey {hotkey} registered")
 
     def unregister_global_hotkey(self):
@@ -489,12 +456,8 @@ class TranslationWindow(QMainWindow):
         if self.global_hotkey_id is not None:
             user32 = ctypes.windll.user32
             user32.UnregisterHotKey(None, self.global_hotkey_id)
+            HOTKEY_DISPATCHER.unregister(self.global_hotkey_id)
             self.global_hotkey_id = None
-        if self.global_hotkey_filter is not None:
-            app = QCoreApplication.instance()
-            if app:
-                app.removeNativeEventFilter(self.global_hotkey_filter)
-            self.global_hotkey_filter = None
             logger.info("Global hotkey listener removed")
 
     def on_global_hotkey_triggered(self):
@@ -674,17 +637,11 @@ class TranslationWindow(QMainWindow):
         """Update capture button appearance based on state."""
         if self.is_capturing:
             self.capture_button.setText("⏸")
-            self.capture_button.setStyleSheet(
-                f"QPushButton {{ background-color: rgba(255,255,255,40); color: #ff0000; border: 1px solid #ff0000; border-radius: 12px; }}"
-                f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-            )
+            self.capture_button.setStyleSheet(_CAPTURE_RUNNING_STYLE)
             logger.info("Screen capture enabled")
         else:
             self.capture_button.setText("▶")
-            self.capture_button.setStyleSheet(
-                f"QPushButton {{ background-color: rgba(255,255,255,40); color: #00ff00; border: 1px solid #00ff00; border-radius: 12px; }}"
-                f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-            )
+            self.capture_button.setStyleSheet(_CAPTURE_IDLE_STYLE)
             logger.info("Screen capture disabled")
     
     def update_auto_pause_status(self):
@@ -692,10 +649,7 @@ class TranslationWindow(QMainWindow):
         if self.auto_paused:
             # Show auto-pause indicator
             self.capture_button.setText("💤")
-            self.capture_button.setStyleSheet(
-                f"QPushButton {{ background-color: rgba(100,100,100,200); color: white; border: 1px solid #666666; border-radius: 12px; font-size: 10pt; }}"
-                f"QPushButton:hover {{ background-color: rgba(100,100,100,255); }}"
-            )
+            self.capture_button.setStyleSheet(_AUTO_PAUSED_STYLE)
             # Update name label to show status
             if hasattr(self, 'name_label'):
                 self.name_label.setText("Auto-Paused (No text detected)")
@@ -732,15 +686,8 @@ class TranslationWindow(QMainWindow):
             x, y, w, h = self.region
             logger.debug(f"Capturing screen region: ({x}, {y}, {w}, {h})")
             
-            # Capture screen in a separate thread
-            def capture_screen():
-                screenshot = pyautogui.screenshot(region=(x, y, w, h))
-                return np.array(screenshot)
-            
-            # Use ThreadPoolExecutor for screen capture
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(capture_screen)
-                screenshot = future.result()
+            # Capture directly; a one-shot worker thread joined at once only added a thread start per tick
+            screenshot = np.array(pyautogui.screenshot(region=(x, y, w, h)))
             
             # Check for frame changes before calling Vision API
             current_frame_hash = self.get_frame_hash(screenshot)
@@ -847,30 +794,23 @@ class TranslationWindow(QMainWindow):
                 self.processing = False
                 return
             
-            # Translate text in a separate thread
-            def translate_text():
-                logger.debug(f"Starting translation: '{text[:50]}...' ({self.settings['source_language']} -> {self.settings['target_language']})")
-                self.rate_limiter.add_request()
-                translated = self.text_processor.translate_text(
-                    text, 
-                    self.settings['target_language'], 
-                    self.settings['source_language']
-                )
-                logger.debug(f"Translation completed: '{translated[:50] if translated else '(empty)'}...'")
-                # Only update Translation API counter if we actually made an API call
-                if not cached_translation:
-                    translation_mode = self.config_manager.get_translation_mode()
-                    if translation_mode == 'local':
-                        self.translation_counter_label.setText(f"LLM: Ready")
-                    elif translation_mode == 'libretranslate':
-                        self.translation_counter_label.setText(f"LibreTranslate: Ready")
-                    else:
-                        self.translation_counter_label.setText(f"Translation API: {self.text_processor.translation_api_calls_today} requests")
-                return translated
-            
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(translate_text)
-                translated_text = future.result()
+            # Translate on this thread so the counter label is only touched from the UI thread
+            logger.debug(f"Starting translation: '{text[:50]}...' ({self.settings['source_language']} -> {self.settings['target_language']})")
+            self.rate_limiter.add_request()
+            translated_text = self.text_processor.translate_text(
+                text, 
+                self.settings['target_language'], 
+                self.settings['source_language']
+            )
+            logger.debug(f"Translation completed: '{translated_text[:50] if translated_text else '(empty)'}...'")
+            # Only update Translation API counter if we actually made an API call
+            if not cached_translation:
+                if translation_mode == 'local':
+                    self.translation_counter_label.setText(f"LLM: Ready")
+                elif translation_mode == 'libretranslate':
+                    self.translation_counter_label.setText(f"LibreTranslate: Ready")
+                else:
+                    self.translation_counter_label.setText(f"Translation API: {self.text_processor.translation_api_calls_today} requests")
             
             # Check if translation was successful
             if not translated_text or translated_text.strip() == "":
@@ -1039,10 +979,6 @@ class TranslationWindow(QMainWindow):
         bg_color.setAlpha(alpha)
         rgba_str = f"rgba({bg_color.red()}, {bg_color.green()}, {bg_color.blue()}, {bg_color.alpha()})"
         self.main_frame.setStyleSheet(f"background-color: {rgba_str}; border-radius: 5px;")
-        self.close_button.setStyleSheet(
-            f"QPushButton {{ background-color: rgba(255,255,255,40); color: #ff0000; border: 1px solid #ff0000; border-radius: 12px; }}"
-            f"QPushButton:hover {{ background-color: rgba(255,255,255,100); color: #ffffff; }}"
-        )
         self.resize_button.setStyleSheet(
             f"QPushButton {{ background-color: {rgba_str}; color: #00ff00; border: 1px solid #00ff00; border-radius: 10px; }}"
             f"QPushButton:hover {{ background-color: rgba(255,255,255,50); color: #00ff00; }}"
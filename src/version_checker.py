@@ -9,21 +9,34 @@ class VersionChecker:
         self.current_version = "2.0.0"
         self.github_repo = "dainn-dev/trans"
         self.latest_release_url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
+        # Seconds to wait for GitHub; the window waits for the check thread on close
+        self.request_timeout = 5
         
     def check_for_updates(self, parent_window=None):
+        update = self.get_available_update()
+        if update:
+            latest_version, download_url = update
+            self.show_update_notification(parent_window, latest_version, download_url)
+            return True
+        return False
+    
+    def get_available_update(self):
+        """Return (latest_version, download_url) if a newer release exists, else None.
+        
+        Performs the network request only, so it is safe to call from a worker thread.
+        """
         try:
-            response = requests.get(self.latest_release_url)
+            response = requests.get(self.latest_release_url, timeout=self.request_timeout)
             if response.status_code == 200:
                 latest_release = response.json()
                 latest_version = latest_release['tag_name'].replace('v', '')
                 
                 if self._compare_versions(latest_version, self.current_version) > 0:
-                    self._show_update_notification(parent_window, latest_version, latest_release['html_url'])
-                    return True
-            return False
+                    return latest_version, latest_release['html_url']
+            return None
         except Exception as e:
             print(f"Error checking for updates: {e}")
-            return False
+            return None
     
     def _compare_versions(self, version1, version2):
         v1_parts = [int(x) for x in version1.split('.')]
@@ -39,7 +52,7 @@ class VersionChecker:
                 return -1
         return 0
     
-    def _show_update_notification(self, parent_window, latest_version, download_url):
+    def show_update_notification(self, parent_window, latest_version, download_url):
         if parent_window:
             # Create a custom dialog
             dialog = ctk.CTkToplevel(parent_window)